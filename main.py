@@ -5,7 +5,7 @@ Excel Differ - Main Entry Point
 Make Excel files version-control friendly by converting them to text.
 
 Commands:
-  flatten  - Flatten a single Excel file to text representation
+  flatten  - Flatten one or more Excel files to text representation
   diff     - Compare two Excel files and show differences
   workflow - Run a complete workflow (source → convert → flatten → destination)
 
@@ -37,7 +37,7 @@ def cli():
 
     \b
     Three main commands:
-      flatten  - Flatten a single Excel file
+      flatten  - Flatten one or more Excel files
       diff     - Compare two Excel files
       workflow - Run complete workflow (the main use case)
 
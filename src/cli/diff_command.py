@@ -21,7 +21,7 @@ from src.utils.logging_setup import setup_logging
 @click.option(
     '--output', '-o',
     type=click.Path(path_type=Path),
-    help='Output file for diff results (default: print to console)'
+    help='Output file for diff results, gzip-compressed if it ends in .gz (default: print to console)'
 )
 @click.option(
     '--format',
@@ -29,7 +29,13 @@ from src.utils.logging_setup import setup_logging
     default='json',
     help='Output format (default: json, html: coming soon)'
 )
-def diff_command(file1, file2, output, format):
+@click.option(
+    '--cache',
+    is_flag=True,
+    default=False,
+    help='Reuse earlier flat output for files already flattened with the same content and name'
+)
+def diff_command(file1, file2, output, format, cache):
     """
     Compare two Excel files.
 
@@ -49,6 +55,12 @@ def diff_command(file1, file2, output, format):
       # Save diff to JSON file
       python main.py diff file1.xlsx file2.xlsx -o diff-result.json
 
+      # Save compressed diff (large workbooks)
+      python main.py diff file1.xlsx file2.xlsx -o diff-result.json.gz
+
+      # Re-diff quickly, reusing earlier flat output
+      python main.py diff file1.xlsx file2.xlsx --cache
+
       # Compare and see results
       python main.py diff old-version.xlsx new-version.xlsx
     """
@@ -63,7 +75,8 @@ def diff_command(file1, file2, output, format):
         'include_literal': True,
         'include_formats': True,
         'timeout': 900,
-        'max_file_size_mb': 200
+        'max_file_size_mb': 200,
+        'use_cache': cache  # Opt-in: reuse earlier flat output (--cache)
     }
 
     try:
@@ -78,7 +91,7 @@ def diff_command(file1, file2, output, format):
 
     # Perform diff
     click.echo(f"\nComparing {file1.name} and {file2.name}...")
-    click.echo("  Step 1/3: Flattening first file...")
+    click.echo("  Flattening both files, then comparing...")
 
     diff_result = differ.diff_files(file1, file2, output_format=format)
 
@@ -107,6 +120,8 @@ def diff_command(file1, file2, output, format):
 
     # Print summary
     click.echo(f"\nSummary:")
+    if diff_result.get('identical'):
+        click.echo(f"  Files are byte-identical (flattening skipped)")
     click.echo(f"  Files compared: {diff_result['files_compared']}")
     click.echo(f"  Files different: {diff_result['files_different']}")
     if diff_result['files_only_in_file1']:
@@ -1,7 +1,9 @@
 """
-Flatten Command - Flatten a single Excel file
+Flatten Command - Flatten one or more Excel files
 
-Extracts a standalone Excel file to text representation.
+Extracts standalone Excel files to text representation. Several files can be
+passed in one call so the flattener (and the openpyxl import) is set up once
+for the whole batch.
 """
 
 import os
@@ -14,7 +16,7 @@ from src.utils.logging_setup import setup_logging
 
 
 @click.command('flatten')
-@click.argument('excel_file', type=click.Path(exists=True, path_type=Path))
+@click.argument('excel_files', nargs=-1, required=True, type=click.Path(exists=True, path_type=Path))
 @click.option(
     '--output-dir', '-o',
     type=click.Path(path_type=Path),
@@ -36,16 +38,16 @@ from src.utils.logging_setup import setup_logging
     help='Include cell formatting (default: True)'
 )
 def flatten_command(
-    excel_file,
+    excel_files,
     output_dir,
     include_computed,
     include_literal,
     include_formats
 ):
     """
-    Flatten an Excel workbook to text files.
+    Flatten Excel workbooks to text files.
 
-    EXCEL_FILE: Path to Excel file (.xlsx, .xlsm, .xlsb, .xls)
+    EXCEL_FILES: One or more paths to Excel files (.xlsx, .xlsm, .xlsb, .xls)
 
     \b
     Examples:
@@ -60,6 +62,9 @@ def flatten_command(
 
       # Custom output directory
       python main.py flatten workbook.xlsx -o ./output
+
+      # Several workbooks in one run (flattener is created once)
+      python main.py flatten budget.xlsx forecast.xlsm
     """
     # Initialize logging
     log_level = os.getenv('EXCEL_DIFFER_LOG_LEVEL', 'INFO').upper()
@@ -83,23 +88,29 @@ def flatten_command(
         click.echo("  Make sure components are registered (call register_all_components()).", err=True)
         sys.exit(1)
 
-    # Flatten workbook
+    # Flatten workbooks (one flattener instance for the whole batch)
+    failed = 0
     try:
-        result = flattener.flatten(excel_file)
-
-        if result.success:
-            click.echo(f"\n✓ Flattening complete!")
-            click.echo(f"  Input: {result.input_path}")
-            click.echo(f"  Output: {result.flat_root}")
-            if result.manifest_path:
-                click.echo(f"  Manifest: {result.manifest_path}")
-            sys.exit(0)
-        else:
-            click.echo(f"\n✗ Flattening failed:", err=True)
-            for error in result.errors:
-                click.echo(f"  - {error}", err=True)
-            sys.exit(1)
+        for excel_file in excel_files:
+            result = flattener.flatten(excel_file)
+
+            if result.success:
+                click.echo(f"\n✓ Flattening complete!")
+                click.echo(f"  Input: {result.input_path}")
+                click.echo(f"  Output: {result.flat_root}")
+                if result.manifest_path:
+                    click.echo(f"  Manifest: {result.manifest_path}")
+            else:
+                failed += 1
+                click.echo(f"\n✗ Flattening failed: {excel_file}", err=True)
+                for error in result.errors:
+                    click.echo(f"  - {error}", err=True)
 
     except Exception as e:
         click.echo(f"\n✗ Unexpected error: {e}", err=True)
         sys.exit(3)
+
+    if len(excel_files) > 1:
+        click.echo(f"\nFlattened {len(excel_files) - failed}/{len(excel_files)} file(s)")
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,136 @@
+"""
+PyxlsbConverter - Convert .xlsb files without Excel
+
+Reads .xlsb (binary) files with pyxlsb and writes the cell values to a new
+.xlsx with openpyxl. Works on any platform and needs no Excel install, but
+only cell values survive - formulas, formatting and VBA are not carried over.
+Use WindowsExcelConverter when a full-fidelity conversion is needed.
+
+Requires:
+- pyxlsb package (optional dependency - converter is only registered if installed)
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+from pyxlsb import open_workbook
+
+from src.interfaces import ConverterInterface, ConversionResult
+
+logger = logging.getLogger(__name__)
+
+
+class PyxlsbConverter(ConverterInterface):
+    """
+    Pure-Python .xlsb → .xlsx converter (values only).
+
+    Uses pyxlsb to read and openpyxl to write - no Excel process involved.
+    """
+
+    def __init__(self, config: dict):
+        """
+        Initialize PyxlsbConverter.
+
+        Args:
+            config: Configuration dict (no options currently)
+        """
+        super().__init__(config)
+
+    def needs_conversion(self, file_path: Path) -> bool:
+        """Returns True for .xlsb files (binary format)"""
+        return file_path.suffix.lower() == '.xlsb'
+
+    def can_convert(self, file_path: Path) -> bool:
+        """Can convert any .xlsb file (pyxlsb is installed if this class was imported)"""
+        return self.needs_conversion(file_path)
+
+    def convert(
+        self,
+        input_path: Path,
+        output_dir: Optional[Path] = None
+    ) -> ConversionResult:
+        """
+        Convert .xlsb file to .xlsx by copying cell values.
+
+        Args:
+            input_path: Path to .xlsb file
+            output_dir: Output directory (default: same as input)
+
+        Returns:
+            ConversionResult with success status and output path
+        """
+        if not self.needs_conversion(input_path):
+            # Not a .xlsb file, no conversion needed
+            return ConversionResult(
+                success=True,
+                input_path=input_path,
+                output_path=None,
+                conversion_performed=False,
+                warnings=["File is not .xlsb, no conversion needed"],
+                errors=[]
+            )
+
+        if not input_path.exists() or not os.access(input_path, os.R_OK):
+            return ConversionResult(
+                success=False,
+                input_path=input_path,
+                output_path=None,
+                conversion_performed=False,
+                warnings=[],
+                errors=[f"Input file not found or not readable: {input_path}"]
+            )
+
+        try:
+            # openpyxl is imported here, not at module level: the registry
+            # imports this module on every start-up when pyxlsb is installed
+            from openpyxl import Workbook
+
+            # Determine output path
+            if output_dir:
+                output_dir = Path(output_dir)
+                output_dir.mkdir(parents=True, exist_ok=True)
+                output_path = output_dir / (input_path.stem + '.xlsx')
+            else:
+                output_path = input_path.parent / (input_path.stem + '.xlsx')
+
+            out_wb = Workbook()
+            out_wb.remove(out_wb.active)
+
+            with open_workbook(str(input_path)) as xlsb:
+                for sheet_name in xlsb.sheets:
+                    out_ws = out_wb.create_sheet(title=sheet_name)
+                    with xlsb.get_sheet(sheet_name) as sheet:
+                        for row in sheet.rows(sparse=True):
+                            for cell in row:
+                                if cell.v is not None:
+                                    out_ws.cell(row=cell.r + 1, column=cell.c + 1, value=cell.v)
+
+            out_wb.save(output_path)
+
+            logger.info(f"Successfully converted {input_path.name} to {output_path.name} (values only)")
+
+            return ConversionResult(
+                success=True,
+                input_path=input_path,
+                output_path=output_path,
+                conversion_performed=True,
+                warnings=["Converted values only - formulas, formatting and VBA are not preserved"],
+                errors=[]
+            )
+
+        except Exception as e:
+            logger.error(f"pyxlsb conversion failed for {input_path.name}: {e}", exc_info=True)
+            return ConversionResult(
+                success=False,
+                input_path=input_path,
+                output_path=None,
+                conversion_performed=False,
+                warnings=[],
+                errors=[f"Conversion failed: {str(e)}"]
+            )
+
+    def get_name(self) -> str:
+        """Return name of this converter implementation"""
+        return "PyxlsbConverter"
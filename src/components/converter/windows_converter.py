@@ -13,11 +13,17 @@ Requires:
 import logging
 import os
 import platform
+import random
+import shutil
 import subprocess
 import sys
+import tempfile
 import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing.util import Finalize
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from src.interfaces import ConverterInterface, ConversionResult
 
@@ -45,6 +51,14 @@ def _decode_com_error(hresult: int) -> str:
     return errors.get(hresult, f"COM error {hresult:#010x}")
 
 
+# HRESULTs meaning the Excel process is gone or wedged (not a per-file problem)
+_EXCEL_DEAD_HRESULTS = {
+    -2147483647,  # RPC call rejected
+    -2147023174,  # RPC server unavailable
+    -2147417848,  # Object disconnected from its clients
+}
+
+
 def _kill_excel_processes():
     """
     Force-kill any hanging Excel processes.
@@ -58,11 +72,57 @@ def _kill_excel_processes():
                 capture_output=True,
                 timeout=5
             )
-            time.sleep(0.5)
+            # Poll until Excel is gone (at most ~1 s) instead of a fixed sleep
+            deadline = time.monotonic() + 1.0
+            while True:
+                check = subprocess.run(
+                    ['tasklist', '/FI', 'IMAGENAME eq EXCEL.EXE', '/NH'],
+                    capture_output=True,
+                    text=True,
+                    timeout=5
+                )
+                if 'EXCEL.EXE' not in check.stdout.upper():
+                    break
+                if time.monotonic() >= deadline:
+                    logger.debug("Excel process still running after taskkill")
+                    break
+                time.sleep(0.1)
     except Exception:
         pass  # Best effort - don't fail if taskkill fails
 
 
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for attempt (0-based), capped at 2 s."""
+    return min(2.0, 0.1 * (2 ** attempt)) + random.uniform(0, 0.1)
+
+
+def _quit_excel(excel) -> bool:
+    """
+    Quit an Excel instance, ignoring errors (best effort).
+
+    Returns:
+        True if Excel quit cleanly (or there was nothing to quit)
+    """
+    try:
+        if excel is not None:
+            excel.Quit()
+        return True
+    except:
+        return False  # Ignore errors - caller decides on forced cleanup
+
+
+def _failed_result(input_path: Path, error: str) -> ConversionResult:
+    """Build a failed ConversionResult for input_path."""
+    return ConversionResult(
+        success=False,
+        input_path=input_path,
+        output_path=None,
+        conversion_performed=False,
+        warnings=[],
+        errors=[error]
+    )
+
+
 class WindowsExcelConverter(ConverterInterface):
     """
     Windows Excel COM-based converter.
@@ -78,6 +138,10 @@ class WindowsExcelConverter(ConverterInterface):
         Args:
             config: Configuration dict with:
                 - timeout: Maximum conversion time in seconds (default: 300)
+                - max_parallel_excel: Excel processes used by convert_many_parallel
+                  (default: 4; each Excel needs roughly 300 MB of RAM)
+                - stage_inputs_locally: Copy every input to the local temp dir
+                  before opening it (default: False; UNC paths are always staged)
 
         Raises:
             RuntimeError: If not running on Windows
@@ -85,6 +149,11 @@ class WindowsExcelConverter(ConverterInterface):
         """
         super().__init__(config)
         self.timeout = config.get('timeout', 300)
+        self.max_parallel_excel = config.get('max_parallel_excel', 4)
+        self.stage_inputs_locally = config.get('stage_inputs_locally', False)
+
+        # Result of the Excel availability probe (None = not probed yet)
+        self._excel_available: Optional[bool] = None
 
         # Check platform
         if platform.system() != 'Windows':
@@ -124,7 +193,7 @@ class WindowsExcelConverter(ConverterInterface):
         Returns True if:
         - Running on Windows
         - File is .xlsb
-        - Excel is available
+        - Excel is available (probed once, re-probed after a COM error)
 
         Args:
             file_path: Path to file to convert
@@ -138,6 +207,15 @@ class WindowsExcelConverter(ConverterInterface):
         if not self.needs_conversion(file_path):
             return False
 
+        # Excel availability was already probed - don't start it again
+        if self._excel_available is not None:
+            return self._excel_available
+
+        self._excel_available = self._probe_excel()
+        return self._excel_available
+
+    def _probe_excel(self) -> bool:
+        """Start and quit Excel to check it is available (with retry)."""
         # Try to check if Excel is available (with retry)
         max_retries = 3
         for attempt in range(max_retries):
@@ -171,12 +249,12 @@ class WindowsExcelConverter(ConverterInterface):
                     pythoncom.CoUninitialize()
 
                     if attempt < max_retries - 1:
-                        time.sleep(0.5)  # Wait before retry
+                        time.sleep(_retry_delay(attempt))  # Wait before retry
 
             except Exception as e:
                 logger.debug(f"Excel COM initialization attempt {attempt + 1}/{max_retries} failed: {e}")
                 if attempt < max_retries - 1:
-                    time.sleep(0.5)
+                    time.sleep(_retry_delay(attempt))
 
         return False
 
@@ -195,50 +273,52 @@ class WindowsExcelConverter(ConverterInterface):
         Returns:
             ConversionResult with success status and output path
         """
-        if not self.needs_conversion(input_path):
-            # Not a .xlsb file, no conversion needed
-            return ConversionResult(
-                success=True,
-                input_path=input_path,
-                output_path=None,
-                conversion_performed=False,
-                warnings=["File is not .xlsb, no conversion needed"],
-                errors=[]
-            )
+        return self.convert_many([input_path], output_dir)[0]
 
-        if not self.can_convert(input_path):
-            return ConversionResult(
-                success=False,
-                input_path=input_path,
-                output_path=None,
-                conversion_performed=False,
-                warnings=[],
-                errors=["Cannot convert: Excel not available or not on Windows"]
-            )
+    def convert_many(
+        self,
+        input_paths: List[Path],
+        output_dir: Optional[Path] = None
+    ) -> List[ConversionResult]:
+        """
+        Convert several .xlsb files using a single Excel instance.
+
+        Excel is started once for the whole batch instead of once per file.
+        A failure on one file is recorded in its result and the batch carries
+        on; if Excel itself stops responding it is restarted for the rest.
+
+        Args:
+            input_paths: Paths to files to convert
+            output_dir: Output directory (default: same as each input)
+
+        Returns:
+            One ConversionResult per input, in input order
+        """
+        results: List[Optional[ConversionResult]] = [None] * len(input_paths)
 
         # Pre-checks
-        if not input_path.exists():
-            return ConversionResult(
-                success=False,
-                input_path=input_path,
-                output_path=None,
-                conversion_performed=False,
-                warnings=[],
-                errors=[f"Input file not found: {input_path}"]
-            )
+        pending = []
+        for i, input_path in enumerate(input_paths):
+            results[i] = self._precheck(input_path)
+            if results[i] is None:
+                pending.append(i)
+
+        if not pending:
+            return results
+
+        if not self.can_convert(input_paths[pending[0]]):
+            for i in pending:
+                results[i] = _failed_result(
+                    input_paths[i], "Cannot convert: Excel not available or not on Windows"
+                )
+            return results
 
-        if not os.access(input_path, os.R_OK):
-            return ConversionResult(
-                success=False,
-                input_path=input_path,
-                output_path=None,
-                conversion_performed=False,
-                warnings=[],
-                errors=[f"Input file not readable: {input_path}"]
-            )
+        if output_dir:
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
 
         excel = None
-        workbook = None
+        needs_force_cleanup = False  # Only taskkill when Excel misbehaved
 
         try:
             # Initialize COM
@@ -247,139 +327,334 @@ class WindowsExcelConverter(ConverterInterface):
             pythoncom.CoInitialize()
 
             try:
-                # Determine output path
-                if output_dir:
-                    output_dir = Path(output_dir)
-                    output_dir.mkdir(parents=True, exist_ok=True)
-                    output_path = output_dir / (input_path.stem + '.xlsm')
-                else:
-                    output_path = input_path.parent / (input_path.stem + '.xlsm')
-
-                # Start NEW Excel instance (DispatchEx creates isolated instance)
-                # This ensures each conversion has its own Excel app - completely hermetic
-                excel = self.win32com.DispatchEx("Excel.Application")
-
-                # Non-critical: Try to set Visible to False
-                try:
-                    excel.Visible = False
-                except:
-                    pass  # Ignore errors - not critical
+                excel = self._start_excel()
+
+                for i in pending:
+                    input_path = input_paths[i]
+                    try:
+                        results[i] = self._convert_one(excel, input_path, output_dir)
+
+                    except pywintypes.com_error as e:
+                        hresult = e.args[0] if e.args else 0
+                        error_msg = _decode_com_error(hresult)
+                        logger.error(
+                            f"Excel COM conversion failed for {input_path.name}: {error_msg}",
+                            exc_info=True
+                        )
+                        results[i] = _failed_result(input_path, f"Excel COM error: {error_msg}")
+
+                        # Re-probe Excel availability on the next call
+                        self._excel_available = None
+                        needs_force_cleanup = True
+
+                        # Excel itself has gone - start a fresh instance for the rest
+                        if hresult in _EXCEL_DEAD_HRESULTS:
+                            _quit_excel(excel)
+                            _kill_excel_processes()
+                            excel = None
+                            needs_force_cleanup = False
+                            excel = self._start_excel()
+
+                    except Exception as e:
+                        logger.error(
+                            f"Excel conversion failed for {input_path.name}: {e}",
+                            exc_info=True
+                        )
+                        results[i] = _failed_result(input_path, f"Conversion failed: {str(e)}")
 
-                # Non-critical: Set DisplayAlerts
-                try:
-                    excel.DisplayAlerts = False
-                except:
-                    pass  # Ignore errors - not critical
+            except Exception as e:
+                # Excel could not be started - fail whatever is left
+                logger.error(f"Excel startup failed: {e}", exc_info=True)
+                needs_force_cleanup = True
+                for i in pending:
+                    if results[i] is None:
+                        results[i] = _failed_result(input_paths[i], f"Conversion failed: {str(e)}")
 
-                # Non-critical: Disable events and updates
-                try:
-                    excel.EnableEvents = False  # Disable events to prevent automation issues
-                    excel.AskToUpdateLinks = False  # Don't prompt for links
-                    excel.ScreenUpdating = False
-                except:
-                    pass
-                # Open workbook - minimal options
-                abs_input = str(input_path.absolute())
-                workbook = excel.Workbooks.Open(abs_input, UpdateLinks=0)
+            finally:
+                # Non-critical cleanup: Ensure Excel is closed
+                if not _quit_excel(excel):
+                    needs_force_cleanup = True
 
-                # Convert: SaveAs with xlsm format
-                # FileFormat 52 = xlOpenXMLWorkbookMacroEnabled (.xlsm)
-                abs_output = str(output_path.absolute())
-                workbook.SaveAs(abs_output, FileFormat=52)
+                # Force cleanup only if Excel did not close cleanly - on the
+                # happy path Excel has already quit
+                if needs_force_cleanup:
+                    try:
+                        _kill_excel_processes()
+                    except:
+                        pass  # Ignore errors - best effort cleanup
 
-                # Non-critical: Close workbook
+                # Non-critical: Uninitialize COM
                 try:
-                    workbook.Close(SaveChanges=False)
+                    pythoncom.CoUninitialize()
                 except:
-                    pass  # Ignore errors - not critical
-                workbook = None
+                    pass  # Ignore errors - best effort cleanup
 
-                # Non-critical: Quit Excel
-                try:
-                    excel.Quit()
-                except:
-                    pass  # Ignore errors - not critical
-                excel = None
+        except Exception as e:
+            # Catch any errors from COM initialization itself
+            logger.error(f"COM initialization failed: {e}", exc_info=True)
+            for i in pending:
+                if results[i] is None:
+                    results[i] = _failed_result(input_paths[i], f"COM initialization failed: {str(e)}")
 
-                logger.info(f"Successfully converted {input_path.name} to {output_path.name}")
+        return results
 
-                return ConversionResult(
-                    success=True,
-                    input_path=input_path,
-                    output_path=output_path,
-                    conversion_performed=True,
-                    warnings=[],
-                    errors=[]
-                )
+    def convert_many_parallel(
+        self,
+        input_paths: List[Path],
+        output_dir: Optional[Path] = None,
+        workers: Optional[int] = None
+    ) -> List[ConversionResult]:
+        """
+        Convert several .xlsb files across a pool of Excel processes.
 
-            except pywintypes.com_error as e:
-                hresult = e.args[0] if e.args else 0
-                error_msg = _decode_com_error(hresult)
-                logger.error(
-                    f"Excel COM conversion failed for {input_path.name}: {error_msg}",
-                    exc_info=True
-                )
-                return ConversionResult(
-                    success=False,
-                    input_path=input_path,
-                    output_path=None,
-                    conversion_performed=False,
-                    warnings=[],
-                    errors=[f"Excel COM error: {error_msg}"]
-                )
+        Each worker process starts its own Excel once and converts its share
+        of the files with it. Falls back to convert_many for a single worker.
 
-            except Exception as e:
-                logger.error(
-                    f"Excel conversion failed for {input_path.name}: {e}",
-                    exc_info=True
-                )
-                return ConversionResult(
-                    success=False,
-                    input_path=input_path,
-                    output_path=None,
-                    conversion_performed=False,
-                    warnings=[],
-                    errors=[f"Conversion failed: {str(e)}"]
+        Args:
+            input_paths: Paths to files to convert
+            output_dir: Output directory (default: same as each input)
+            workers: Number of Excel processes (default: max_parallel_excel)
+
+        Returns:
+            One ConversionResult per input, in input order
+        """
+        results: List[Optional[ConversionResult]] = [None] * len(input_paths)
+
+        pending = []
+        for i, input_path in enumerate(input_paths):
+            results[i] = self._precheck(input_path)
+            if results[i] is None:
+                pending.append(i)
+
+        workers = min(workers or self.max_parallel_excel, len(pending))
+        if workers <= 1:
+            return self.convert_many(input_paths, output_dir)
+
+        if not self.can_convert(input_paths[pending[0]]):
+            for i in pending:
+                results[i] = _failed_result(
+                    input_paths[i], "Cannot convert: Excel not available or not on Windows"
                 )
+            return results
 
-            finally:
-                # Non-critical cleanup: Ensure Excel is closed
-                try:
-                    if workbook is not None:
-                        workbook.Close(SaveChanges=False)
-                except:
-                    pass  # Ignore errors - best effort cleanup
+        if output_dir:
+            output_dir = Path(output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
 
-                try:
-                    if excel is not None:
-                        excel.Quit()
-                except:
-                    pass  # Ignore errors - best effort cleanup
+        paths = [input_paths[i] for i in pending]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_worker_init,
+                initargs=(self.config,)
+            ) as executor:
+                for i, result in zip(pending, executor.map(_worker_convert, paths, repeat(output_dir))):
+                    results[i] = result
+        except Exception as e:
+            # Pool broke (worker crashed) - fail whatever has no result yet
+            logger.error(f"Parallel conversion failed: {e}", exc_info=True)
+            for i in pending:
+                if results[i] is None:
+                    results[i] = _failed_result(input_paths[i], f"Conversion failed: {str(e)}")
 
-                # Non-critical: Force cleanup - kill any hanging Excel processes
-                try:
-                    _kill_excel_processes()
-                except:
-                    pass  # Ignore errors - best effort cleanup
+        return results
 
-                # Non-critical: Uninitialize COM
-                try:
-                    pythoncom.CoUninitialize()
-                except:
-                    pass  # Ignore errors - best effort cleanup
+    def _precheck(self, input_path: Path) -> Optional[ConversionResult]:
+        """
+        Check a single input before starting Excel.
 
-        except Exception as e:
-            # Catch any errors from COM initialization itself
-            logger.error(f"COM initialization failed: {e}", exc_info=True)
+        Returns:
+            ConversionResult if the file needs no COM work (not .xlsb, or
+            unusable), None if it should be converted
+        """
+        if not self.needs_conversion(input_path):
+            # Not a .xlsb file, no conversion needed
             return ConversionResult(
-                success=False,
+                success=True,
                 input_path=input_path,
                 output_path=None,
                 conversion_performed=False,
-                warnings=[],
-                errors=[f"COM initialization failed: {str(e)}"]
+                warnings=["File is not .xlsb, no conversion needed"],
+                errors=[]
             )
 
+        if not input_path.exists():
+            return _failed_result(input_path, f"Input file not found: {input_path}")
+
+        if not os.access(input_path, os.R_OK):
+            return _failed_result(input_path, f"Input file not readable: {input_path}")
+
+        return None
+
+    def _stage_input(self, input_path: Path) -> Optional[Path]:
+        """
+        Copy input to the local temp dir if it lives on a slow path.
+
+        Slow means a UNC path (\\\\server\\share) or any path when the
+        stage_inputs_locally option is set.
+
+        Returns:
+            Path of the local copy, or None if the input is used in place
+        """
+        if not (self.stage_inputs_locally or str(input_path.absolute()).startswith('\\\\')):
+            return None
+
+        fd, temp_name = tempfile.mkstemp(suffix=input_path.suffix, prefix=input_path.stem + '-')
+        os.close(fd)
+        shutil.copyfile(input_path, temp_name)
+        logger.debug(f"Staged {input_path} to {temp_name}")
+        return Path(temp_name)
+
+    def _start_excel(self):
+        """Start a new hidden Excel instance set up for automation."""
+        # DispatchEx creates an isolated instance (never reuses the user's Excel)
+        excel = self.win32com.DispatchEx("Excel.Application")
+
+        # Non-critical: Try to set Visible to False
+        try:
+            excel.Visible = False
+        except:
+            pass  # Ignore errors - not critical
+
+        # Non-critical: Set DisplayAlerts
+        try:
+            excel.DisplayAlerts = False
+        except:
+            pass  # Ignore errors - not critical
+
+        # Non-critical: Disable events and updates
+        try:
+            excel.EnableEvents = False  # Disable events to prevent automation issues
+            excel.AskToUpdateLinks = False  # Don't prompt for links
+            excel.ScreenUpdating = False
+        except:
+            pass
+
+        return excel
+
+    def _convert_one(
+        self,
+        excel,
+        input_path: Path,
+        output_dir: Optional[Path]
+    ) -> ConversionResult:
+        """
+        Open, SaveAs .xlsm and close one workbook in a running Excel.
+
+        COM errors are raised to the caller.
+        """
+        # Determine output path
+        if output_dir:
+            output_path = output_dir / (input_path.stem + '.xlsm')
+        else:
+            output_path = input_path.parent / (input_path.stem + '.xlsm')
+
+        # excel.Calculation and excel.CalculateBeforeSave are deliberately left
+        # alone: they are application-wide and Excel writes them into every
+        # workbook it saves (calcMode, calcOnSave), which would change the
+        # converted file's calculation settings.
+
+        # Inputs on network shares are copied locally first - Excel reads
+        # .xlsb records at scattered offsets, each a network round-trip
+        staged_path = self._stage_input(input_path)
+
+        try:
+            # Open workbook read-only: no write lock, no prompts, no MRU entry
+            abs_input = str((staged_path or input_path).absolute())
+            workbook = excel.Workbooks.Open(
+                abs_input,
+                UpdateLinks=0,
+                ReadOnly=True,
+                IgnoreReadOnlyRecommended=True,
+                Notify=False,
+                AddToMru=False
+            )
+
+            try:
+                # Convert: SaveAs with xlsm format
+                # FileFormat 52 = xlOpenXMLWorkbookMacroEnabled (.xlsm)
+                # ConflictResolution 2 = xlLocalSessionChanges (no merge dialog)
+                abs_output = str(output_path.absolute())
+                workbook.SaveAs(abs_output, FileFormat=52, ConflictResolution=2)
+            finally:
+                # Non-critical: Close workbook
+                try:
+                    workbook.Close(SaveChanges=False)
+                except:
+                    pass  # Ignore errors - not critical
+        finally:
+            if staged_path is not None:
+                try:
+                    staged_path.unlink()
+                except OSError:
+                    pass  # Ignore errors - temp dir is cleaned eventually
+
+        logger.info(f"Successfully converted {input_path.name} to {output_path.name}")
+
+        return ConversionResult(
+            success=True,
+            input_path=input_path,
+            output_path=output_path,
+            conversion_performed=True,
+            warnings=[],
+            errors=[]
+        )
+
     def get_name(self) -> str:
         """Return name of this converter implementation"""
         return "WindowsExcelConverter"
+
+
+# Per-process state for convert_many_parallel workers
+_worker_converter: Optional[WindowsExcelConverter] = None
+_worker_excel = None
+
+
+def _worker_init(config: dict) -> None:
+    """Pool initializer: start one Excel for this worker process."""
+    global _worker_converter, _worker_excel
+    import pythoncom
+    pythoncom.CoInitialize()
+    _worker_converter = WindowsExcelConverter(config)
+    _worker_excel = _worker_converter._start_excel()
+    # Runs when the worker process exits
+    Finalize(None, _worker_shutdown, exitpriority=10)
+
+
+def _worker_shutdown() -> None:
+    """Quit this worker's Excel and uninitialize COM."""
+    _quit_excel(_worker_excel)
+    try:
+        import pythoncom
+        pythoncom.CoUninitialize()
+    except:
+        pass  # Ignore errors - best effort cleanup
+
+
+def _worker_convert(input_path: Path, output_dir: Optional[Path]) -> ConversionResult:
+    """Convert one file with this worker's Excel."""
+    global _worker_excel
+    import pywintypes
+    try:
+        return _worker_converter._convert_one(_worker_excel, input_path, output_dir)
+
+    except pywintypes.com_error as e:
+        hresult = e.args[0] if e.args else 0
+        error_msg = _decode_com_error(hresult)
+        logger.error(f"Excel COM conversion failed for {input_path.name}: {error_msg}")
+
+        # Restart only this worker's Excel - taskkill would take down the
+        # other workers' instances too
+        if hresult in _EXCEL_DEAD_HRESULTS:
+            _quit_excel(_worker_excel)
+            _worker_excel = None
+            try:
+                _worker_excel = _worker_converter._start_excel()
+            except Exception as start_error:
+                logger.error(f"Excel restart failed: {start_error}")
+
+        return _failed_result(input_path, f"Excel COM error: {error_msg}")
+
+    except Exception as e:
+        logger.error(f"Excel conversion failed for {input_path.name}: {e}")
+        return _failed_result(input_path, f"Conversion failed: {str(e)}")
@@ -5,17 +5,37 @@ Minimal implementation - uses client for all HTTP operations.
 State management handled by StateManager.
 """
 
+import json
 import logging
+import os
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from src.interfaces import DestinationInterface, UploadResult
 from src.utils.bitbucket_client import BitbucketClient
+from src.utils.file_utils import iter_files
+from src.utils.hash_utils import get_file_hash
 
 
 logger = logging.getLogger(__name__)
 
 
+def _extract_sha(result: dict) -> Optional[str]:
+    """
+    Get the commit id from an upload response.
+
+    Checks 'hash' (top-level, then under 'commit') and finally 'id', which is
+    what Data Center returns for the created commit.
+    """
+    sha = result.get('hash')
+    if sha:
+        return sha
+    commit = result.get('commit')
+    if isinstance(commit, dict) and commit.get('hash'):
+        return commit['hash']
+    return result.get('id')
+
+
 class BitbucketDestination(DestinationInterface):
     """
     Bitbucket repository destination implementation.
@@ -32,13 +52,32 @@ class BitbucketDestination(DestinationInterface):
                 - url: Full API base URL (e.g., https://api.bitbucket.org/2.0/repositories/workspace/repo)
                 - branch: Branch name (required)
                 - output_path: Where to upload in repo (optional, default: "")
+                - upload_cache_file: JSON file recording the sha256 of each uploaded
+                  repo path, per url and branch; unchanged files are then skipped
+                  (optional, default: off)
         """
         super().__init__(config)
         self.url = config['url']
         self.branch = config['branch']
         self.output_path = config.get('output_path', '').strip('/')
 
-        # Initialize client - it gets token from environment automatically
+        # Prefix for every repo path (empty when uploading to the repo root)
+        self._repo_prefix = f"{self.output_path}/" if self.output_path else ''
+
+        # Content hashes of previous uploads (opt-in). The file holds
+        # {url: {branch: {repo_path: sha256}}}; _upload_cache is the section
+        # for this url and branch
+        cache_file = config.get('upload_cache_file')
+        self.upload_cache_file = Path(cache_file) if cache_file else None
+        self._upload_cache_all = self._load_upload_cache()
+        self._upload_cache = None
+        if self._upload_cache_all is not None:
+            self._upload_cache = (
+                self._upload_cache_all.setdefault(self.url, {}).setdefault(self.branch, {})
+            )
+
+        # Initialize client - it gets token from environment automatically.
+        # Its pooled session is reused for every upload this destination makes
         self.client = BitbucketClient(base_url=self.url)
 
         logger.info(
@@ -54,19 +93,28 @@ class BitbucketDestination(DestinationInterface):
     ) -> UploadResult:
         """Upload single file to Bitbucket repository."""
         try:
-            # Read file content
-            with open(local_file, 'rb') as f:
-                content = f.read()
-
             # Determine full path in repository
-            repo_path = f"{self.output_path}/{remote_path}" if self.output_path else remote_path
+            repo_path = self._repo_prefix + remote_path
 
-            # Upload using client
-            files = {repo_path: content}
+            # Skip the round-trip if this exact content was uploaded before
+            digests = self._changed_digests({repo_path: Path(local_file)})
+            if not digests:
+                logger.info(f"Skipped {local_file.name}: unchanged since last upload to {repo_path}")
+                return UploadResult(
+                    success=True,
+                    version=None,
+                    files_uploaded=[],
+                    message=f"{local_file.name} unchanged at {repo_path}, upload skipped",
+                    errors=[]
+                )
+
+            # Upload using client (file is read from disk during the upload)
+            files = {repo_path: Path(local_file)}
             result = self.client.upload_files(branch=self.branch, files=files, message=message)
+            self._record_uploads(digests)
 
             # Extract commit SHA from response
-            version = result.get('hash') or result.get('commit', {}).get('hash')
+            version = _extract_sha(result)
 
             logger.info(f"Uploaded {local_file.name} to {repo_path} (commit: {version})")
 
@@ -94,28 +142,68 @@ class BitbucketDestination(DestinationInterface):
         remote_path: str,
         message: str
     ) -> UploadResult:
-        """Upload entire directory to Bitbucket repository in single commit."""
+        """
+        Upload entire directory to Bitbucket repository.
+
+        The Data Center browse endpoint takes one file per request, so each
+        file becomes its own commit (all with the same message). The returned
+        version is the last of those commits.
+        """
         try:
-            # Collect all files in directory
-            files_to_upload = {}
             uploaded_paths = []
 
-            for file_path in local_dir.rglob('*'):
-                if file_path.is_file():
-                    # Get relative path within the directory
-                    rel_path = file_path.relative_to(local_dir)
+            # Repo prefix for this directory, built once (forward slashes)
+            prefix = self._repo_prefix + remote_path
+            prefix = prefix.replace('\\', '/').rstrip('/')
 
-                    # Determine full path in repository
-                    repo_path = f"{self.output_path}/{remote_path}/{rel_path}" if self.output_path else f"{remote_path}/{rel_path}"
-                    repo_path = repo_path.replace('\\', '/')  # Normalize path separators
-
-                    # Read file content
-                    with open(file_path, 'rb') as f:
-                        files_to_upload[repo_path] = (repo_path, f.read())
+            # Walk with os.scandir; relative paths are sliced off the root
+            root_len = len(os.path.join(os.fspath(local_dir), ''))
 
+            def walk():
+                """Yield (repo_path, local Path) pairs as the walk finds files."""
+                for file_path in iter_files(local_dir):
+                    rel_path = file_path[root_len:]
+                    if os.sep != '/':
+                        rel_path = rel_path.replace(os.sep, '/')  # Normalize path separators
+                    repo_path = f"{prefix}/{rel_path}"
                     uploaded_paths.append(Path(repo_path))
+                    yield repo_path, Path(file_path)
+
+            if self._upload_cache is None:
+                # Client consumes the walk lazily - each file is uploaded as
+                # soon as it is found and opened only while it is sent
+                result = self.client.upload_files(branch=self.branch, files=walk(), message=message)
+            else:
+                # Hashes are needed up front to drop unchanged files
+                files_to_upload = dict(walk())
+                digests = self._changed_digests(files_to_upload)
+                if files_to_upload and not digests:
+                    logger.info(f"Skipped directory {local_dir.name}: all files unchanged since last upload")
+                    return UploadResult(
+                        success=True,
+                        version=None,
+                        files_uploaded=[],
+                        message=f"Directory {local_dir.name} unchanged at {remote_path}, upload skipped",
+                        errors=[]
+                    )
+                uploaded_paths = [Path(repo_path) for repo_path in digests]
+
+                # One file per call (each is its own commit anyway), so a
+                # failure partway still records the files already committed
+                result = {}
+                uploaded = {}
+                try:
+                    for repo_path, digest in digests.items():
+                        result = self.client.upload_files(
+                            branch=self.branch,
+                            files={repo_path: files_to_upload[repo_path]},
+                            message=message
+                        )
+                        uploaded[repo_path] = digest
+                finally:
+                    self._record_uploads(uploaded)
 
-            if not files_to_upload:
+            if not uploaded_paths:
                 logger.warning(f"No files found in {local_dir}")
                 return UploadResult(
                     success=True,
@@ -125,22 +213,19 @@ class BitbucketDestination(DestinationInterface):
                     errors=[]
                 )
 
-            # Upload all files in a single commit using client
-            result = self.client.upload_files(branch=self.branch, files=files_to_upload, message=message)
-
-            # Extract commit SHA from response
-            version = result.get('hash') or result.get('commit', {}).get('hash')
+            # Extract commit SHA from response (last file's commit)
+            version = _extract_sha(result)
 
             logger.info(
                 f"Uploaded directory {local_dir.name} to {remote_path} "
-                f"({len(files_to_upload)} files, commit: {version})"
+                f"({len(uploaded_paths)} files, last commit: {version})"
             )
 
             return UploadResult(
                 success=True,
                 version=version,
                 files_uploaded=uploaded_paths,
-                message=f"Uploaded directory {local_dir.name} to {remote_path} ({len(files_to_upload)} files)",
+                message=f"Uploaded directory {local_dir.name} to {remote_path} ({len(uploaded_paths)} files)",
                 errors=[]
             )
 
@@ -154,6 +239,64 @@ class BitbucketDestination(DestinationInterface):
                 errors=[str(e)]
             )
 
+    def _load_upload_cache(self) -> Optional[dict]:
+        """Load {url: {branch: {repo_path: sha256}}} from upload_cache_file (None if disabled)."""
+        if self.upload_cache_file is None:
+            return None
+        try:
+            with open(self.upload_cache_file, 'rb') as f:
+                cache = json.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable upload cache {self.upload_cache_file}: {e}")
+            return {}
+
+        if not isinstance(cache, dict):
+            logger.warning(f"Ignoring malformed upload cache {self.upload_cache_file}")
+            return {}
+        # Keep only well-formed url -> branch -> {repo_path: sha256} sections
+        return {
+            url: {branch: paths for branch, paths in branches.items() if isinstance(paths, dict)}
+            for url, branches in cache.items()
+            if isinstance(branches, dict)
+        }
+
+    def _changed_digests(self, files: dict) -> dict:
+        """
+        Hash local files and keep those that differ from the last upload.
+
+        Args:
+            files: Dict of {repo_path: local Path}
+
+        Returns:
+            Dict of {repo_path: sha256} for files that need uploading (all of
+            them when the cache is disabled)
+        """
+        if self._upload_cache is None:
+            return dict.fromkeys(files)
+
+        changed = {}
+        for repo_path, local_path in files.items():
+            digest = get_file_hash(local_path)
+            if self._upload_cache.get(repo_path) != digest:
+                changed[repo_path] = digest
+        return changed
+
+    def _record_uploads(self, digests: dict) -> None:
+        """Store hashes of uploaded files and persist the cache (atomic write)."""
+        if self._upload_cache is None or not digests:
+            return
+        self._upload_cache.update(digests)
+        self.upload_cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.upload_cache_file.with_suffix('.tmp')
+        temp_file.write_bytes(json.dumps(self._upload_cache_all, indent=2, sort_keys=True).encode('utf-8'))
+        temp_file.replace(self.upload_cache_file)
+
+    def close(self) -> None:
+        """Close the client's pooled connections."""
+        self.client.close()
+
     def get_name(self) -> str:
         """Return name of this destination implementation"""
         return "BitbucketDestination"
@@ -5,11 +5,18 @@ Simple destination that writes files to a local directory.
 State management handled by StateManager.
 """
 
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from typing import List
 
 from src.interfaces import DestinationInterface, UploadResult
+from src.utils.file_utils import copy_file, iter_tree
+
+# Threads used to copy files in upload_directory
+COPY_WORKERS = min(32, (os.cpu_count() or 1) * 2)
 
 
 class LocalDestination(DestinationInterface):
@@ -33,6 +40,9 @@ class LocalDestination(DestinationInterface):
         # Create destination folder if it doesn't exist
         self.folder_path.mkdir(parents=True, exist_ok=True)
 
+        # Directories already created by upload_file (skips repeat mkdir stats)
+        self._known_dirs = {self.folder_path}
+
     def upload_file(
         self,
         local_file: Path,
@@ -54,11 +64,14 @@ class LocalDestination(DestinationInterface):
             # Determine destination path
             dest_path = self.folder_path / remote_path
 
-            # Create parent directories if needed
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            # Create parent directories if needed (once per directory)
+            parent = dest_path.parent
+            if parent not in self._known_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(parent)
 
-            # Copy file
-            shutil.copy2(local_file, dest_path)
+            # Copy file (kernel-side copy where supported, metadata preserved)
+            copy_file(local_file, dest_path)
 
             # Get version (current timestamp)
             version = datetime.now().isoformat()
@@ -104,13 +117,33 @@ class LocalDestination(DestinationInterface):
             # Remove destination if it exists (full replacement)
             if dest_path.exists():
                 shutil.rmtree(dest_path)
-
-            # Copy entire directory tree
-            shutil.copytree(local_dir, dest_path)
+                # Directories under it are gone - forget them
+                self._known_dirs = {d for d in self._known_dirs if not d.is_relative_to(dest_path)}
+
+            # Plan copies: walk once, create all directories up front (empty
+            # ones too). Symlinks are followed and copied as regular files and
+            # directories, as shutil.copytree did
+            root_len = len(os.path.join(os.fspath(local_dir), ''))
+            dest_root = os.fspath(dest_path)
+            pairs = []
+            dest_dirs = []
+            for src, is_dir in iter_tree(local_dir, follow_symlinks=True):
+                dst = os.path.join(dest_root, src[root_len:])
+                if is_dir:
+                    dest_dirs.append(dst)
+                else:
+                    pairs.append((src, dst))
+
+            dest_path.mkdir(parents=True, exist_ok=True)
+            for dest_dir in dest_dirs:
+                os.makedirs(dest_dir, exist_ok=True)
+
+            # Copy files concurrently - many small files are syscall-bound
+            with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+                list(executor.map(lambda pair: copy_file(*pair), pairs))
 
             # List all uploaded files
-            uploaded_files: List[Path] = list(dest_path.rglob('*'))
-            uploaded_files = [f for f in uploaded_files if f.is_file()]
+            uploaded_files: List[Path] = [Path(dst) for _, dst in pairs]
 
             # Get version (current timestamp)
             version = datetime.now().isoformat()
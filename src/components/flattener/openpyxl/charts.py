@@ -14,6 +14,8 @@ from openpyxl.chart import (
     ScatterChart, BubbleChart, RadarChart
 )
 
+from .utils import HashingTextWriter
+
 logger = logging.getLogger(__name__)
 
 
@@ -211,7 +213,7 @@ def _extract_axes(chart) -> Dict[str, Any]:
     return axes_info
 
 
-def write_charts_file(charts: List[Dict[str, Any]], output_path: Path) -> None:
+def write_charts_file(charts: List[Dict[str, Any]], output_path: Path) -> str:
     """
     Write charts information to text file.
 
@@ -239,16 +241,19 @@ def write_charts_file(charts: List[Dict[str, Any]], output_path: Path) -> None:
     Args:
         charts: List of chart dictionaries
         output_path: Path to output file
+
+    Returns:
+        SHA256 hash of the written file
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with HashingTextWriter(output_path) as f:
         f.write('# Charts\n')
         f.write('# ' + '=' * 50 + '\n\n')
 
         if not charts:
             f.write('(No charts found)\n')
-            return
+            return f.hexdigest()
 
         for chart in charts:
             f.write(f"Chart {chart['index']}:\n")
@@ -304,3 +309,5 @@ def write_charts_file(charts: List[Dict[str, Any]], output_path: Path) -> None:
             f.write('\n')
 
     logger.debug(f"Wrote charts to: {output_path}")
+
+    return f.hexdigest()
@@ -4,38 +4,73 @@ Main Flattener class - orchestrates Excel workbook flattening.
 Coordinates all extraction modules to produce a deterministic, diff-friendly
 text representation of an Excel workbook.
 """
+import functools
+import hashlib
+import json
 import logging
-import shutil
+import os
+import stat
 import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from openpyxl import load_workbook
 from openpyxl.workbook import Workbook
 
-from .utils import (
-    get_file_hash,
-    create_flat_root_name,
-)
+from src.utils.file_utils import copy_file
+from src.utils.hash_utils import get_file_hash
+
+from .utils import create_flat_root_name
 from .manifest import Manifest
-from .metadata import extract_metadata, write_metadata_file
-from .workbook_structure import extract_structure, write_structure_file
-from .sheets import SheetExtractor, write_formulas_file, write_values_file, write_formats_file
-from .vba import extract_vba, write_vba_files, write_vba_summary
-from .tables import extract_tables, write_tables_file, extract_autofilters, write_autofilters_file
-from .charts import extract_charts, write_charts_file
-from .named_ranges import extract_named_ranges, write_named_ranges_file
+
+# The extractor modules (and the openpyxl chart/table machinery and oletools
+# they pull in) are imported inside the _extract_* methods that use them
 
 logger = logging.getLogger(__name__)
 
+# Extensions openpyxl can load (.xlsb must be converted first)
+VALID_EXTENSIONS = frozenset({'.xlsx', '.xlsm', '.xls'})
+
+# Workbook parts that can be extracted (see the sections option)
+SECTIONS = frozenset({
+    'metadata',
+    'structure',
+    'sheets',
+    'vba',
+    'tables',
+    'charts',
+    'named_ranges',
+})
+
+# Subdirectory of output_dir holding cache entries (cache key -> flat root name)
+CACHE_DIR_NAME = '.cache'
+
+# Upper bound on sheets extracted concurrently
+SHEET_WORKERS = 8
+
+# warnings.catch_warnings swaps the process-wide filter list and is not
+# thread-safe; a timed-out extraction can still be loading when the next starts
+_WARNINGS_LOCK = threading.Lock()
+
+# Characters not allowed in sheet directory names, all mapped to '_'
+_SHEET_NAME_TABLE = str.maketrans(dict.fromkeys('/\\:*?"<>|', '_'))
+
 
 class TimeoutError(Exception):
     """Raised when extraction exceeds timeout."""
     pass
 
 
+def _check_cancelled(cancelled: Optional[threading.Event]) -> None:
+    """Raise TimeoutError if the extraction has been cancelled."""
+    if cancelled is not None and cancelled.is_set():
+        raise TimeoutError("Extraction cancelled after timeout")
+
+
 class Flattener:
     """
     Excel workbook flattener.
@@ -51,7 +86,9 @@ class Flattener:
         include_formats: bool = True,
         include_origin_file: bool = False,
         timeout: int = 900,
-        max_file_size_mb: int = 200
+        max_file_size_mb: int = 200,
+        use_cache: bool = False,
+        sections: Optional[List[str]] = None
     ):
         """
         Initialise flattener.
@@ -64,6 +101,13 @@ class Flattener:
             include_origin_file: Whether to include original Excel file in output [default: False]
             timeout: Maximum extraction time in seconds [default: 900]
             max_file_size_mb: Maximum file size in MB [default: 200]
+            use_cache: Reuse an existing flat root in output_dir when the same
+                file (by hash) was already flattened with the same options [default: False]
+            sections: Parts of the workbook to extract, any of SECTIONS
+                [default: None - all sections]
+
+        Raises:
+            ValueError: If sections names an unknown section
         """
         self.output_dir = Path(output_dir)
         self.include_computed = include_computed
@@ -72,6 +116,18 @@ class Flattener:
         self.include_origin_file = include_origin_file
         self.timeout = timeout
         self.max_file_size_mb = max_file_size_mb
+        self.use_cache = use_cache
+
+        if sections is None:
+            self.sections = SECTIONS
+        else:
+            unknown = set(sections) - SECTIONS
+            if unknown:
+                raise ValueError(
+                    f"Unknown flattener sections: {', '.join(sorted(unknown))} "
+                    f"(valid: {', '.join(sorted(SECTIONS))})"
+                )
+            self.sections = frozenset(sections)
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -103,6 +159,8 @@ class Flattener:
 
         # Setup timeout handler (platform-independent)
         timeout_event = threading.Event()
+        # Set on timeout; the extraction thread stops at its next checkpoint
+        cancelled = threading.Event()
         result_container = {'flat_root': None, 'error': None}
 
         def extraction_task():
@@ -116,6 +174,15 @@ class Flattener:
                 file_hash = get_file_hash(excel_file)
                 logger.info(f"File hash: {file_hash[:16]}...")
 
+                # Reuse a previous extraction of identical content
+                if self.use_cache:
+                    cache_key = self._cache_key(file_hash, excel_file.name, origin)
+                    cached_root = self._get_cached_flat_root(cache_key)
+                    if cached_root is not None:
+                        logger.info(f"✓ Reusing cached extraction: {cached_root.name}")
+                        result_container['flat_root'] = cached_root
+                        return
+
                 # Create flat root directory
                 timestamp = datetime.now(timezone.utc)
                 flat_root_name = create_flat_root_name(excel_file.stem, timestamp, file_hash[:8])
@@ -128,7 +195,8 @@ class Flattener:
                 manifest = Manifest(
                     workbook_filename=excel_file.name,
                     original_sha256=file_hash,
-                    include_computed=self.include_computed
+                    include_computed=self.include_computed,
+                    extracted_at=timestamp
                 )
 
                 # Set origin if provided
@@ -140,24 +208,36 @@ class Flattener:
                 # Load workbook
                 logger.info("Loading workbook...")
                 wb = self._load_workbook(excel_file)
-
-                # Extract all components
-                self._extract_metadata(wb, flat_root, manifest)
-                self._extract_structure(wb, flat_root, manifest)
-                self._extract_sheets(wb, flat_root, manifest)
-                self._extract_vba(excel_file, flat_root, manifest)
-                self._extract_tables(wb, flat_root, manifest)
-                self._extract_charts(wb, flat_root, manifest)
-                self._extract_named_ranges(wb, flat_root, manifest)
+                _check_cancelled(cancelled)
+
+                # Extract the selected components (all by default)
+                if 'metadata' in self.sections:
+                    self._extract_metadata(wb, flat_root, manifest)
+                if 'structure' in self.sections:
+                    self._extract_structure(wb, flat_root, manifest)
+                if 'sheets' in self.sections:
+                    self._extract_sheets(wb, flat_root, manifest, cancelled)
+                    _check_cancelled(cancelled)
+                if 'vba' in self.sections:
+                    self._extract_vba(excel_file, flat_root, manifest)
+                    _check_cancelled(cancelled)
+                if 'tables' in self.sections:
+                    self._extract_tables(wb, flat_root, manifest)
+                if 'charts' in self.sections:
+                    self._extract_charts(wb, flat_root, manifest)
+                if 'named_ranges' in self.sections:
+                    self._extract_named_ranges(wb, flat_root, manifest)
 
                 # Copy original file if requested
                 if self.include_origin_file:
+                    _check_cancelled(cancelled)
                     self._copy_origin_file(excel_file, flat_root, manifest)
 
                 # Save manifest
+                _check_cancelled(cancelled)
                 manifest_path = flat_root / 'manifest.json'
-                manifest.save(manifest_path)
-                manifest.add_file(manifest_path, flat_root)
+                manifest_hash = manifest.save(manifest_path)
+                manifest.add_file(manifest_path, flat_root, sha256=manifest_hash)
 
                 logger.info(f"=" * 70)
                 logger.info(f"✓ Extraction complete: {flat_root_name}")
@@ -165,6 +245,9 @@ class Flattener:
                 logger.info(f"  Warnings: {len(manifest.warnings)}")
                 logger.info(f"=" * 70)
 
+                if self.use_cache:
+                    self._store_cached_flat_root(cache_key, flat_root)
+
                 result_container['flat_root'] = flat_root
 
             except Exception as e:
@@ -179,7 +262,9 @@ class Flattener:
             thread.join(timeout=self.timeout)
 
             if thread.is_alive():
-                # Timeout occurred
+                # Timeout occurred - a Python thread cannot be killed, so ask
+                # it to stop at the next stage or sheet boundary
+                cancelled.set()
                 logger.error(f"Extraction exceeded timeout of {self.timeout}s")
                 raise TimeoutError(f"Extraction exceeded timeout of {self.timeout}s")
         else:
@@ -202,14 +287,17 @@ class Flattener:
         Raises:
             ValueError: If file is invalid
         """
-        if not file_path.exists():
-            raise ValueError(f"File not found: {file_path}")
+        # One stat call answers exists, is-a-file and size
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            raise ValueError(f"File not found: {file_path}") from None
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Not a file: {file_path}")
 
         # Check file size
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+        file_size_mb = st.st_size / (1024 * 1024)
         if file_size_mb > self.max_file_size_mb:
             raise ValueError(
                 f"File too large: {file_size_mb:.1f}MB "
@@ -218,20 +306,89 @@ class Flattener:
 
         # Check extension
         # Note: .xlsb files are NOT supported by openpyxl and must be converted first
-        valid_extensions = ['.xlsx', '.xlsm', '.xls']
-        if file_path.suffix.lower() not in valid_extensions:
+        if file_path.suffix.lower() not in VALID_EXTENSIONS:
             raise ValueError(
                 f"Unsupported file type: {file_path.suffix} "
-                f"(supported: {', '.join(valid_extensions)}). "
+                f"(supported: {', '.join(sorted(VALID_EXTENSIONS))}). "
                 f"Note: .xlsb files require conversion using WindowsExcelConverter"
             )
 
         logger.info(f"✓ File validated ({file_size_mb:.1f}MB)")
 
+    def _cache_key(self, file_hash: str, filename: str, origin: Optional[str]) -> str:
+        """
+        Build the cache key for an extraction.
+
+        Covers everything that affects the output: file content, file name
+        (recorded in the manifest and the flat root name), extractor version
+        and the extraction options.
+
+        Args:
+            file_hash: SHA256 of the Excel file
+            filename: Name of the Excel file
+            origin: Origin recorded in the manifest
+
+        Returns:
+            Hex key naming the cache entry
+        """
+        options = json.dumps({
+            'include_computed': self.include_computed,
+            'include_literal': self.include_literal,
+            'include_formats': self.include_formats,
+            'include_origin_file': self.include_origin_file,
+            'filename': filename,
+            'origin': origin,
+            'sections': sorted(self.sections),
+        }, sort_keys=True)
+        return hashlib.sha256(f"{file_hash}:{Manifest.VERSION}:{options}".encode('utf-8')).hexdigest()
+
+    def _get_cached_flat_root(self, cache_key: str) -> Optional[Path]:
+        """
+        Look up a previous flat root for this cache key.
+
+        Args:
+            cache_key: Key from _cache_key()
+
+        Returns:
+            Path to the flat root, or None if there is no entry or the flat
+            root is gone or incomplete (no manifest.json)
+        """
+        entry = self.output_dir / CACHE_DIR_NAME / cache_key
+        try:
+            flat_root = self.output_dir / entry.read_text(encoding='utf-8').strip()
+        except OSError:
+            return None
+
+        if not (flat_root / 'manifest.json').is_file():
+            return None
+        return flat_root
+
+    def _store_cached_flat_root(self, cache_key: str, flat_root: Path) -> None:
+        """
+        Record flat_root as the extraction for cache_key (atomic write).
+
+        Args:
+            cache_key: Key from _cache_key()
+            flat_root: Completed flat root directory
+        """
+        try:
+            cache_dir = self.output_dir / CACHE_DIR_NAME
+            cache_dir.mkdir(exist_ok=True)
+            entry = cache_dir / cache_key
+            temp_file = entry.with_suffix('.tmp')
+            temp_file.write_text(flat_root.name, encoding='utf-8')
+            temp_file.replace(entry)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry for {flat_root.name}: {e}")
+
     def _load_workbook(self, file_path: Path) -> Workbook:
         """
         Load workbook with openpyxl.
 
+        Full (not read_only) mode is required: read-only worksheets expose no
+        merged cells, tables, charts, tab colours or sheet properties, which
+        the extractors all read.
+
         Args:
             file_path: Path to Excel file
 
@@ -241,12 +398,13 @@ class Flattener:
         try:
             # Load with data_only=False to get formulas
             # Suppress openpyxl warnings about unsupported features (conditional formatting, etc.)
-            with warnings.catch_warnings():
+            with _WARNINGS_LOCK, warnings.catch_warnings():
                 warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
                 wb = load_workbook(
                     filename=str(file_path),
                     data_only=False,
-                    keep_vba=False  # VBA extracted separately with oletools
+                    keep_vba=False,  # VBA extracted separately with oletools
+                    keep_links=False  # External link caches are never flattened
                 )
             logger.info(f"✓ Workbook loaded ({len(wb.worksheets)} sheets)")
             return wb
@@ -257,18 +415,20 @@ class Flattener:
 
     def _extract_metadata(self, wb: Workbook, flat_root: Path, manifest: Manifest) -> None:
         """Extract workbook metadata."""
+        from .metadata import extract_metadata, write_metadata_file
         logger.info("Extracting metadata...")
         try:
             metadata = extract_metadata(wb)
             metadata_path = flat_root / 'metadata.txt'
-            write_metadata_file(metadata, metadata_path)
-            manifest.add_file(metadata_path, flat_root)
+            file_hash = write_metadata_file(metadata, metadata_path)
+            manifest.add_file(metadata_path, flat_root, sha256=file_hash)
         except Exception as e:
             logger.error(f"Error extracting metadata: {e}", exc_info=True)
             manifest.add_warning(f"Metadata extraction failed: {e}")
 
     def _extract_structure(self, wb: Workbook, flat_root: Path, manifest: Manifest) -> None:
         """Extract workbook structure."""
+        from .workbook_structure import extract_structure, write_structure_file
         logger.info("Extracting structure...")
         try:
             structure = extract_structure(wb)
@@ -283,73 +443,132 @@ class Flattener:
                 )
 
             structure_path = flat_root / 'workbook-structure.txt'
-            write_structure_file(structure, structure_path)
-            manifest.add_file(structure_path, flat_root)
+            file_hash = write_structure_file(structure, structure_path)
+            manifest.add_file(structure_path, flat_root, sha256=file_hash)
 
         except Exception as e:
             logger.error(f"Error extracting structure: {e}", exc_info=True)
             manifest.add_warning(f"Structure extraction failed: {e}")
 
-    def _extract_sheets(self, wb: Workbook, flat_root: Path, manifest: Manifest) -> None:
-        """Extract sheet data."""
+    def _extract_sheets(
+        self,
+        wb: Workbook,
+        flat_root: Path,
+        manifest: Manifest,
+        cancelled: Optional[threading.Event] = None
+    ) -> None:
+        """
+        Extract sheet data.
+
+        Sheets are independent, so each one is extracted and written on a
+        worker thread. The manifest is only touched from this thread, in
+        workbook sheet order, so its contents match a sequential run.
+
+        Raises:
+            TimeoutError: If cancelled is set before all sheets are started
+        """
         logger.info("Extracting sheets...")
 
         sheets_dir = flat_root / 'sheets'
-        sheets_dir.mkdir(exist_ok=True)
-
-        for ws in wb.worksheets:
-            sheet_name = ws.title
-            logger.info(f"  Processing sheet: {sheet_name}")
+        worksheets = wb.worksheets
+        sheet_dirs = [sheets_dir / self._sanitise_sheet_name(ws.title) for ws in worksheets]
 
+        # Create the whole directory tree up front, one mkdir per unique directory
+        unique_dirs = set(sheet_dirs)
+        for directory in [sheets_dir, *unique_dirs]:
             try:
-                extractor = SheetExtractor(ws, include_computed=self.include_computed)
-
-                # Create sheet directory
-                # Sanitise sheet name for filesystem
-                safe_name = self._sanitise_sheet_name(sheet_name)
-                sheet_dir = sheets_dir / safe_name
-                sheet_dir.mkdir(exist_ok=True)
-
-                # Extract formulas - ALWAYS create TWO files (row-order and column-order)
-                formulas = extractor.extract_formulas()
-
-                # Row-by-row order (A1, A2, A3, B1, B2, B3...) - useful for row patterns
-                formulas_row_path = sheet_dir / 'formulas-by-row.txt'
-                write_formulas_file(sheet_name, formulas, formulas_row_path, sort_order='row')
-                manifest.add_file(formulas_row_path, flat_root)
-
-                # Column-by-column order (A1, B1, C1, A2, B2, C2...) - useful for column patterns
-                formulas_col_path = sheet_dir / 'formulas-by-column.txt'
-                write_formulas_file(sheet_name, formulas, formulas_col_path, sort_order='column')
-                manifest.add_file(formulas_col_path, flat_root)
-
-                # Extract literal values - create file if enabled (default: True)
-                if self.include_literal:
-                    literal_values = extractor.extract_literal_values()
-                    literal_path = sheet_dir / 'literal-values.txt'
-                    write_values_file(sheet_name, literal_values, literal_path, file_type='literal')
-                    manifest.add_file(literal_path, flat_root)
-
-                # Extract computed values - create file if enabled (default: False)
-                if self.include_computed:
-                    computed_values = extractor.extract_computed_values()
-                    computed_path = sheet_dir / 'computed-values.txt'
-                    write_values_file(sheet_name, computed_values, computed_path, file_type='computed')
-                    manifest.add_file(computed_path, flat_root)
-
-                # Extract formats - create file if enabled (default: True)
-                if self.include_formats:
-                    formats = extractor.extract_formats()
-                    formats_path = sheet_dir / 'formats.txt'
-                    write_formats_file(sheet_name, formats, formats_path)
-                    manifest.add_file(formats_path, flat_root)
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
+
+        if not worksheets:
+            return
+
+        # Two sheets can sanitise to the same directory; extract those
+        # sequentially so the later sheet still wins, as it always has
+        max_workers = min(SHEET_WORKERS, len(worksheets))
+        if len(unique_dirs) != len(sheet_dirs):
+            max_workers = 1
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self._extract_sheet, worksheets, sheet_dirs, repeat(cancelled))
+            for written, warning in results:
+                for path, file_hash in written:
+                    manifest.add_file(path, flat_root, sha256=file_hash)
+                if warning:
+                    manifest.add_warning(warning)
+
+    def _extract_sheet(
+        self,
+        ws,
+        sheet_dir: Path,
+        cancelled: Optional[threading.Event] = None
+    ) -> Tuple[List[Tuple[Path, str]], Optional[str]]:
+        """
+        Extract and write the files for one sheet (runs on a worker thread).
 
-            except Exception as e:
-                logger.error(f"Error extracting sheet {sheet_name}: {e}", exc_info=True)
-                manifest.add_warning(f"Sheet '{sheet_name}' extraction failed: {e}")
+        Args:
+            ws: Worksheet to extract
+            sheet_dir: Output directory for this sheet (already created)
+            cancelled: Event set when the extraction has timed out
+
+        Returns:
+            Tuple of ((path, sha256) for each file written, in manifest order;
+            warning message or None)
+        """
+        from .sheets import SheetExtractor, write_formulas_file, write_values_file, write_formats_file
+        _check_cancelled(cancelled)
+
+        sheet_name = ws.title
+        logger.info(f"  Processing sheet: {sheet_name}")
+
+        written = []
+        try:
+            extractor = SheetExtractor(ws, include_computed=self.include_computed)
+
+            # Extract formulas - ALWAYS create TWO files (row-order and column-order)
+            formulas = extractor.extract_formulas()
+
+            # Row-by-row order (A1, A2, A3, B1, B2, B3...) - useful for row patterns
+            formulas_row_path = sheet_dir / 'formulas-by-row.txt'
+            file_hash = write_formulas_file(sheet_name, formulas, formulas_row_path, sort_order='row')
+            written.append((formulas_row_path, file_hash))
+
+            # Column-by-column order (A1, B1, C1, A2, B2, C2...) - useful for column patterns
+            formulas_col_path = sheet_dir / 'formulas-by-column.txt'
+            file_hash = write_formulas_file(sheet_name, formulas, formulas_col_path, sort_order='column')
+            written.append((formulas_col_path, file_hash))
+
+            # Extract literal values - create file if enabled (default: True)
+            if self.include_literal:
+                literal_values = extractor.extract_literal_values()
+                literal_path = sheet_dir / 'literal-values.txt'
+                file_hash = write_values_file(sheet_name, literal_values, literal_path, file_type='literal')
+                written.append((literal_path, file_hash))
+
+            # Extract computed values - create file if enabled (default: False)
+            if self.include_computed:
+                computed_values = extractor.extract_computed_values()
+                computed_path = sheet_dir / 'computed-values.txt'
+                file_hash = write_values_file(sheet_name, computed_values, computed_path, file_type='computed')
+                written.append((computed_path, file_hash))
+
+            # Extract formats - create file if enabled (default: True)
+            if self.include_formats:
+                formats = extractor.extract_formats()
+                formats_path = sheet_dir / 'formats.txt'
+                file_hash = write_formats_file(sheet_name, formats, formats_path)
+                written.append((formats_path, file_hash))
+
+        except Exception as e:
+            logger.error(f"Error extracting sheet {sheet_name}: {e}", exc_info=True)
+            return written, f"Sheet '{sheet_name}' extraction failed: {e}"
+
+        return written, None
 
     def _extract_vba(self, excel_file: Path, flat_root: Path, manifest: Manifest) -> None:
         """Extract VBA macros."""
+        from .vba import extract_vba, write_vba_files, write_vba_summary
         logger.info("Extracting VBA...")
         try:
             vba_info = extract_vba(excel_file)
@@ -365,8 +584,8 @@ class Flattener:
 
                 # Write summary
                 summary_path = vba_dir / 'vba-summary.txt'
-                write_vba_summary(vba_info, summary_path)
-                manifest.add_file(summary_path, flat_root)
+                file_hash = write_vba_summary(vba_info, summary_path)
+                manifest.add_file(summary_path, flat_root, sha256=file_hash)
 
         except Exception as e:
             logger.error(f"Error extracting VBA: {e}", exc_info=True)
@@ -374,19 +593,20 @@ class Flattener:
 
     def _extract_tables(self, wb: Workbook, flat_root: Path, manifest: Manifest) -> None:
         """Extract tables and autofilters."""
+        from .tables import extract_tables, write_tables_file, extract_autofilters, write_autofilters_file
         logger.info("Extracting tables...")
         try:
             # Tables - ALWAYS create file
             tables = extract_tables(wb)
             tables_path = flat_root / 'tables.txt'
-            write_tables_file(tables, tables_path)
-            manifest.add_file(tables_path, flat_root)
+            file_hash = write_tables_file(tables, tables_path)
+            manifest.add_file(tables_path, flat_root, sha256=file_hash)
 
             # Autofilters - ALWAYS create file
             autofilters = extract_autofilters(wb)
             autofilters_path = flat_root / 'autofilters.txt'
-            write_autofilters_file(autofilters, autofilters_path)
-            manifest.add_file(autofilters_path, flat_root)
+            file_hash = write_autofilters_file(autofilters, autofilters_path)
+            manifest.add_file(autofilters_path, flat_root, sha256=file_hash)
 
         except Exception as e:
             logger.error(f"Error extracting tables: {e}", exc_info=True)
@@ -394,13 +614,14 @@ class Flattener:
 
     def _extract_charts(self, wb: Workbook, flat_root: Path, manifest: Manifest) -> None:
         """Extract charts."""
+        from .charts import extract_charts, write_charts_file
         logger.info("Extracting charts...")
         try:
             # Charts - ALWAYS create file
             charts = extract_charts(wb)
             charts_path = flat_root / 'charts.txt'
-            write_charts_file(charts, charts_path)
-            manifest.add_file(charts_path, flat_root)
+            file_hash = write_charts_file(charts, charts_path)
+            manifest.add_file(charts_path, flat_root, sha256=file_hash)
 
         except Exception as e:
             logger.error(f"Error extracting charts: {e}", exc_info=True)
@@ -408,13 +629,14 @@ class Flattener:
 
     def _extract_named_ranges(self, wb: Workbook, flat_root: Path, manifest: Manifest) -> None:
         """Extract named ranges."""
+        from .named_ranges import extract_named_ranges, write_named_ranges_file
         logger.info("Extracting named ranges...")
         try:
             # Named ranges - ALWAYS create file
             named_ranges = extract_named_ranges(wb)
             named_ranges_path = flat_root / 'named-ranges.txt'
-            write_named_ranges_file(named_ranges, named_ranges_path)
-            manifest.add_file(named_ranges_path, flat_root)
+            file_hash = write_named_ranges_file(named_ranges, named_ranges_path)
+            manifest.add_file(named_ranges_path, flat_root, sha256=file_hash)
 
         except Exception as e:
             logger.error(f"Error extracting named ranges: {e}", exc_info=True)
@@ -437,10 +659,10 @@ class Flattener:
 
             # Copy file with original name and extension
             dest_file = origin_dir / excel_file.name
-            shutil.copy2(excel_file, dest_file)
+            copy_file(excel_file, dest_file)
 
-            # Add to manifest
-            manifest.add_file(dest_file, flat_root)
+            # Add to manifest - the copy has the same bytes as the hashed original
+            manifest.add_file(dest_file, flat_root, sha256=manifest.original_sha256)
 
             logger.info(f"Original file copied: {excel_file.name}")
 
@@ -458,28 +680,20 @@ class Flattener:
         Returns:
             Sanitised name
         """
-        # Replace problematic characters
-        replacements = {
-            '/': '_',
-            '\\': '_',
-            ':': '_',
-            '*': '_',
-            '?': '_',
-            '"': '_',
-            '<': '_',
-            '>': '_',
-            '|': '_',
-        }
-
-        sanitised = name
-        for char, replacement in replacements.items():
-            sanitised = sanitised.replace(char, replacement)
-
-        # Remove leading/trailing spaces and dots
-        sanitised = sanitised.strip().strip('.')
-
-        # Ensure not empty
-        if not sanitised:
-            sanitised = 'sheet'
-
-        return sanitised
+        return _sanitise_sheet_name(name)
+
+
+@functools.lru_cache(maxsize=256)
+def _sanitise_sheet_name(name: str) -> str:
+    """Sanitise a sheet name for use as a directory name (cached)."""
+    # Replace problematic characters in one pass
+    sanitised = name.translate(_SHEET_NAME_TABLE)
+
+    # Remove leading/trailing spaces and dots
+    sanitised = sanitised.strip().strip('.')
+
+    # Ensure not empty
+    if not sanitised:
+        sanitised = 'sheet'
+
+    return sanitised
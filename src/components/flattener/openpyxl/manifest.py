@@ -3,16 +3,28 @@ Manifest generation for flattened Excel workbooks.
 
 The manifest is a JSON file that describes the extraction and lists all files.
 """
+import hashlib
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from .utils import get_file_hash
+from src.utils.hash_utils import get_file_hash
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Threads used to hash queued files (hashlib releases the GIL while hashing)
+HASH_WORKERS = 8
+
 
 class Manifest:
     """
@@ -23,11 +35,25 @@ class Manifest:
 
     VERSION = "2.1.0"
 
+    __slots__ = (
+        'workbook_filename',
+        'original_sha256',
+        'extracted_at',
+        'extractor_version',
+        'include_computed',
+        'sheets',
+        'files',
+        'warnings',
+        'origin',
+        '_pending',
+    )
+
     def __init__(
         self,
         workbook_filename: str,
         original_sha256: str,
         include_computed: bool = False,
+        extracted_at: Optional[datetime] = None,
     ):
         """
         Initialise a new manifest.
@@ -36,10 +62,11 @@ class Manifest:
             workbook_filename: Name of original Excel file
             original_sha256: SHA256 hash of original file
             include_computed: Whether computed values were extracted
+            extracted_at: Extraction time (default: now, UTC)
         """
         self.workbook_filename = workbook_filename
         self.original_sha256 = original_sha256
-        self.extracted_at = datetime.now(timezone.utc).isoformat()
+        self.extracted_at = (extracted_at or datetime.now(timezone.utc)).isoformat()
         self.extractor_version = self.VERSION
         self.include_computed = include_computed
 
@@ -48,6 +75,9 @@ class Manifest:
         self.warnings: List[str] = []
         self.origin: Optional[Dict[str, Any]] = None
 
+        # Files added but not yet hashed: (file_info entry, absolute path)
+        self._pending: List[Tuple[Dict[str, str], Path]] = []
+
         logger.debug(f"Manifest initialised for {workbook_filename}")
 
     def add_sheet(
@@ -75,13 +105,18 @@ class Manifest:
         self.sheets.append(sheet_info)
         logger.debug(f"Added sheet to manifest: {name} (index={index})")
 
-    def add_file(self, file_path: Path, flat_root: Path) -> None:
+    def add_file(self, file_path: Path, flat_root: Path, sha256: Optional[str] = None) -> None:
         """
-        Add a file to the manifest with its hash.
+        Add a file to the manifest.
+
+        Unless sha256 is given, the file is hashed later, together with the
+        other queued files, by hash_files() (called automatically by
+        to_dict/save).
 
         Args:
             file_path: Absolute path to file
             flat_root: Path to flat root directory
+            sha256: Hash of the file when already known (skips re-reading it)
         """
         # Calculate relative path from flat root
         try:
@@ -90,16 +125,38 @@ class Manifest:
             logger.warning(f"File {file_path} is not under flat root {flat_root}")
             return
 
-        # Calculate file hash
-        file_hash = get_file_hash(file_path)
-
         file_info = {
             'path': str(relative_path).replace('\\', '/'),  # Use forward slashes
-            'sha256': file_hash
+            'sha256': sha256  # None until hash_files() runs
         }
         self.files.append(file_info)
+        if sha256 is None:
+            self._pending.append((file_info, file_path))
         logger.debug(f"Added file to manifest: {relative_path}")
 
+    def hash_files(self) -> None:
+        """
+        Calculate the hashes of all files added since the last call.
+
+        Hashes are computed on a thread pool; file order is unaffected.
+        """
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        paths = [file_path for _, file_path in pending]
+
+        if len(paths) == 1:
+            hashes = [get_file_hash(paths[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(paths))) as executor:
+                hashes = list(executor.map(get_file_hash, paths))
+
+        for (file_info, _), file_hash in zip(pending, hashes):
+            file_info['sha256'] = file_hash
+
+        logger.debug(f"Hashed {len(paths)} manifest files")
+
     def add_warning(self, message: str) -> None:
         """
         Add a warning message to the manifest.
@@ -133,6 +190,8 @@ class Manifest:
         Returns:
             Dictionary representation of manifest
         """
+        self.hash_files()
+
         data = {
             'workbook_filename': self.workbook_filename,
             'original_sha256': self.original_sha256,
@@ -149,20 +208,37 @@ class Manifest:
 
         return data
 
-    def save(self, path: Path) -> None:
+    def save(self, path: Path) -> str:
         """
         Save manifest to JSON file.
 
+        The document is serialised to bytes in one pass (with orjson when
+        installed - same indented layout) and written with a single call.
+
         Args:
             path: Path to manifest file (typically manifest.json)
+
+        Returns:
+            SHA256 hash of the written file
         """
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.to_dict(), indent=2, ensure_ascii=False).encode('utf-8')
+
+        # Keep the platform line endings the text-mode writer used to produce
+        if os.linesep != '\n':
+            data = data.replace(b'\n', os.linesep.encode('ascii'))
+
+        path.write_bytes(data)
+        file_hash = hashlib.sha256(data).hexdigest()
 
         logger.info(f"Saved manifest: {path}")
 
+        return file_hash
+
     @classmethod
     def load(cls, path: Path) -> 'Manifest':
         """
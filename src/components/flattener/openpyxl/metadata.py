@@ -11,6 +11,7 @@ from typing import Dict, Any
 from openpyxl.workbook import Workbook
 
 from .normalizer import normalise_date_value
+from .utils import HashingTextWriter
 
 logger = logging.getLogger(__name__)
 
@@ -94,7 +95,7 @@ def extract_metadata(wb: Workbook) -> Dict[str, Any]:
     return metadata
 
 
-def write_metadata_file(metadata: Dict[str, Any], output_path: Path) -> None:
+def write_metadata_file(metadata: Dict[str, Any], output_path: Path) -> str:
     """
     Write metadata to a text file.
 
@@ -103,10 +104,13 @@ def write_metadata_file(metadata: Dict[str, Any], output_path: Path) -> None:
     Args:
         metadata: Metadata dictionary
         output_path: Path to output file
+
+    Returns:
+        SHA256 hash of the written file
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with HashingTextWriter(output_path) as f:
         f.write('# Workbook Metadata\n')
         f.write('# ==================\n\n')
 
@@ -115,6 +119,8 @@ def write_metadata_file(metadata: Dict[str, Any], output_path: Path) -> None:
 
     logger.debug(f"Wrote metadata to: {output_path}")
 
+    return f.hexdigest()
+
 
 def _get_excel_version(wb: Workbook) -> str:
     """
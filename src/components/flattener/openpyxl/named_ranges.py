@@ -9,6 +9,8 @@ from typing import Dict, Any, List
 
 from openpyxl.workbook import Workbook
 
+from .utils import HashingTextWriter
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,7 +93,7 @@ def _get_range_type(defn) -> str:
     return 'constant'
 
 
-def write_named_ranges_file(named_ranges: List[Dict[str, Any]], output_path: Path) -> None:
+def write_named_ranges_file(named_ranges: List[Dict[str, Any]], output_path: Path) -> str:
     """
     Write named ranges to text file.
 
@@ -110,16 +112,19 @@ def write_named_ranges_file(named_ranges: List[Dict[str, Any]], output_path: Pat
     Args:
         named_ranges: List of named range dictionaries
         output_path: Path to output file
+
+    Returns:
+        SHA256 hash of the written file
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with HashingTextWriter(output_path) as f:
         f.write('# Named Ranges\n')
         f.write('# ' + '=' * 50 + '\n\n')
 
         if not named_ranges:
             f.write('(No named ranges found)\n')
-            return
+            return f.hexdigest()
 
         for nr in named_ranges:
             f.write(f"Name: {nr['name']}\n")
@@ -133,3 +138,5 @@ def write_named_ranges_file(named_ranges: List[Dict[str, Any]], output_path: Pat
             f.write('\n')
 
     logger.debug(f"Wrote named ranges to: {output_path}")
+
+    return f.hexdigest()
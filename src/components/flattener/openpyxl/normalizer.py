@@ -326,8 +326,5 @@ def sort_columns_by_address(rows: list) -> list:
     """
     from .utils import sort_key_for_cell_address
 
-    # Sort by (col, row) instead of (row, col)
-    return sorted(rows, key=lambda x: (
-        sort_key_for_cell_address(x['address'])[1],  # column first
-        sort_key_for_cell_address(x['address'])[0]   # then row
-    ))
+    # Sort by (col, row) instead of (row, col) - one address parse per row
+    return sorted(rows, key=lambda x: sort_key_for_cell_address(x['address'])[::-1])
@@ -10,7 +10,6 @@ from typing import Optional
 import logging
 
 from src.interfaces import FlattenerInterface, FlattenResult
-from .flattener import Flattener
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +34,10 @@ class OpenpyxlFlattener(FlattenerInterface):
                 - include_origin_file: Include original Excel file in output (optional, default: False)
                 - timeout: Maximum extraction time in seconds (optional, default: 900)
                 - max_file_size_mb: Maximum file size in MB (optional, default: 200)
+                - use_cache: Reuse the previous flat root for a file already flattened
+                  with the same options (optional, default: False)
+                - sections: List of workbook parts to extract - metadata, structure,
+                  sheets, vba, tables, charts, named_ranges (optional, default: all)
         """
         super().__init__(config)
 
@@ -46,8 +49,13 @@ class OpenpyxlFlattener(FlattenerInterface):
         include_origin_file = config.get('include_origin_file', False)
         timeout = config.get('timeout', 900)
         max_file_size_mb = config.get('max_file_size_mb', 200)
+        use_cache = config.get('use_cache', False)
+        sections = config.get('sections')
 
-        # Create the underlying flattener
+        # Create the underlying flattener. Imported here so that registering
+        # components (and commands that never flatten) don't pay for loading
+        # openpyxl and oletools
+        from .flattener import Flattener
         self.flattener = Flattener(
             output_dir=output_dir,
             include_computed=include_computed,
@@ -55,7 +63,9 @@ class OpenpyxlFlattener(FlattenerInterface):
             include_formats=include_formats,
             include_origin_file=include_origin_file,
             timeout=timeout,
-            max_file_size_mb=max_file_size_mb
+            max_file_size_mb=max_file_size_mb,
+            use_cache=use_cache,
+            sections=sections
         )
 
         logger.info(f"OpenpyxlFlattener initialized with output_dir={output_dir}")
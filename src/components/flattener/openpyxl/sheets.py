@@ -16,6 +16,7 @@ from .normalizer import (
     normalise_line_endings,
     sort_rows_by_address
 )
+from .utils import HashingTextWriter
 
 logger = logging.getLogger(__name__)
 
@@ -299,7 +300,7 @@ class SheetExtractor:
         return format_info if format_info else None
 
 
-def write_formulas_file(sheet_name: str, formulas: List[Dict[str, str]], output_path: Path, sort_order: str = 'row') -> None:
+def write_formulas_file(sheet_name: str, formulas: List[Dict[str, str]], output_path: Path, sort_order: str = 'row') -> str:
     """
     Write formulas to text file.
 
@@ -310,6 +311,9 @@ def write_formulas_file(sheet_name: str, formulas: List[Dict[str, str]], output_
         formulas: List of formula dictionaries
         output_path: Path to output file
         sort_order: 'row' for row-major (A1,A2,A3,B1...) or 'column' for column-major (A1,B1,C1,A2...)
+
+    Returns:
+        SHA256 hash of the written file
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -323,7 +327,7 @@ def write_formulas_file(sheet_name: str, formulas: List[Dict[str, str]], output_
         sorted_formulas = formulas
         order_desc = 'row-by-row (A1, A2, A3, B1, B2, B3...)'
 
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with HashingTextWriter(output_path) as f:
         f.write(f'# Formulas: {sheet_name}\n')
         f.write(f'# Order: {order_desc}\n')
         f.write('# ' + '=' * 50 + '\n\n')
@@ -334,8 +338,10 @@ def write_formulas_file(sheet_name: str, formulas: List[Dict[str, str]], output_
 
     logger.debug(f"Wrote formulas ({sort_order}-order) to: {output_path}")
 
+    return f.hexdigest()
+
 
-def write_values_file(sheet_name: str, values: List[Dict[str, str]], output_path: Path, file_type: str = 'literal') -> None:
+def write_values_file(sheet_name: str, values: List[Dict[str, str]], output_path: Path, file_type: str = 'literal') -> str:
     """
     Write values to text file.
 
@@ -346,12 +352,15 @@ def write_values_file(sheet_name: str, values: List[Dict[str, str]], output_path
         values: List of value dictionaries
         output_path: Path to output file
         file_type: 'literal' or 'computed'
+
+    Returns:
+        SHA256 hash of the written file
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     title = 'Literal Values' if file_type == 'literal' else 'Computed Values'
 
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with HashingTextWriter(output_path) as f:
         f.write(f'# {title}: {sheet_name}\n')
         f.write('# ' + '=' * 50 + '\n\n')
 
@@ -361,8 +370,10 @@ def write_values_file(sheet_name: str, values: List[Dict[str, str]], output_path
 
     logger.debug(f"Wrote {file_type} values to: {output_path}")
 
+    return f.hexdigest()
 
-def write_formats_file(sheet_name: str, formats: List[Dict[str, Any]], output_path: Path) -> None:
+
+def write_formats_file(sheet_name: str, formats: List[Dict[str, Any]], output_path: Path) -> str:
     """
     Write formatting information to text file.
 
@@ -378,10 +389,13 @@ def write_formats_file(sheet_name: str, formats: List[Dict[str, Any]], output_pa
         sheet_name: Name of sheet
         formats: List of format dictionaries
         output_path: Path to output file
+
+    Returns:
+        SHA256 hash of the written file
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with HashingTextWriter(output_path) as f:
         f.write(f'# Formats: {sheet_name}\n')
         f.write('# ' + '=' * 50 + '\n\n')
 
@@ -392,6 +406,8 @@ def write_formats_file(sheet_name: str, formats: List[Dict[str, Any]], output_pa
 
     logger.debug(f"Wrote formats to: {output_path}")
 
+    return f.hexdigest()
+
 
 def _write_format_dict(f, format_dict: Dict[str, Any], indent: int = 0) -> None:
     """
@@ -10,6 +10,8 @@ from typing import Dict, Any, List
 from openpyxl.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 
+from .utils import HashingTextWriter
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,7 +99,7 @@ def _extract_sheet_tables(ws: Worksheet) -> List[Dict[str, Any]]:
     return tables
 
 
-def write_tables_file(tables: List[Dict[str, Any]], output_path: Path) -> None:
+def write_tables_file(tables: List[Dict[str, Any]], output_path: Path) -> str:
     """
     Write tables information to text file.
 
@@ -116,16 +118,19 @@ def write_tables_file(tables: List[Dict[str, Any]], output_path: Path) -> None:
     Args:
         tables: List of table dictionaries
         output_path: Path to output file
+
+    Returns:
+        SHA256 hash of the written file
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with HashingTextWriter(output_path) as f:
         f.write('# Excel Tables\n')
         f.write('# ' + '=' * 50 + '\n\n')
 
         if not tables:
             f.write('(No tables found)\n')
-            return
+            return f.hexdigest()
 
         for table in tables:
             f.write(f"Table: {table['name']}\n")
@@ -151,6 +156,8 @@ def write_tables_file(tables: List[Dict[str, Any]], output_path: Path) -> None:
 
     logger.debug(f"Wrote tables to: {output_path}")
 
+    return f.hexdigest()
+
 
 def extract_autofilters(wb: Workbook) -> List[Dict[str, Any]]:
     """
@@ -185,7 +192,7 @@ def extract_autofilters(wb: Workbook) -> List[Dict[str, Any]]:
     return autofilters
 
 
-def write_autofilters_file(autofilters: List[Dict[str, Any]], output_path: Path) -> None:
+def write_autofilters_file(autofilters: List[Dict[str, Any]], output_path: Path) -> str:
     """
     Write autofilter information to text file.
 
@@ -196,16 +203,19 @@ def write_autofilters_file(autofilters: List[Dict[str, Any]], output_path: Path)
     Args:
         autofilters: List of autofilter dictionaries
         output_path: Path to output file
+
+    Returns:
+        SHA256 hash of the written file
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with HashingTextWriter(output_path) as f:
         f.write('# AutoFilters\n')
         f.write('# ' + '=' * 50 + '\n\n')
 
         if not autofilters:
             f.write('(No autofilters found)\n')
-            return
+            return f.hexdigest()
 
         for filter_info in autofilters:
             f.write(f"Sheet: {filter_info['sheet']}\n")
@@ -213,3 +223,5 @@ def write_autofilters_file(autofilters: List[Dict[str, Any]], output_path: Path)
             f.write('\n')
 
     logger.debug(f"Wrote autofilters to: {output_path}")
+
+    return f.hexdigest()
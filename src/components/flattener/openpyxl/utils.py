@@ -1,37 +1,69 @@
 """
 Utility functions for the Excel Flattener.
 
-Provides file hashing, path handling, and configuration loading.
+Provides hashing file writers, path handling, and configuration loading.
 """
-import hashlib
+import functools
+import io
 import re
+import string
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
+
+from src.utils.hash_utils import new_hash
 
 # ============================================================================
 # File Operations
 # ============================================================================
 
-def get_file_hash(file_path: Path, algorithm: str = 'sha256') -> str:
+class _HashingFileIO(io.FileIO):
+    """Raw file that hashes every byte written to it."""
+
+    def __init__(self, file_path: Path):
+        super().__init__(file_path, 'w')
+        self.hash_obj = new_hash()
+
+    def write(self, data) -> int:
+        written = super().write(data)
+        self.hash_obj.update(memoryview(data)[:written])
+        return written
+
+
+class HashingTextWriter(io.TextIOWrapper):
     """
-    Calculate hash of a file.
+    UTF-8 text file writer that computes the SHA256 of what it writes.
 
-    Args:
-        file_path: Path to file
-        algorithm: Hash algorithm (default: sha256)
+    Behaves like open(path, 'w', encoding='utf-8'), including newline
+    translation; the hash covers the bytes exactly as written to disk, so
+    the file never has to be read back to be hashed.
 
-    Returns:
-        Hex string of file hash
+    Example:
+        with HashingTextWriter(path) as f:
+            f.write('text')
+        file_hash = f.hexdigest()
     """
-    hash_obj = hashlib.new(algorithm)
 
-    with open(file_path, 'rb') as f:
-        # Read in chunks for large files
-        for chunk in iter(lambda: f.read(8192), b''):
-            hash_obj.update(chunk)
+    def __init__(self, file_path: Path, errors: Optional[str] = None):
+        self._raw = _HashingFileIO(file_path)
+        super().__init__(io.BufferedWriter(self._raw), encoding='utf-8', errors=errors)
+
+    def hexdigest(self) -> str:
+        """Return the SHA256 of everything written so far (flushes first)."""
+        if not self.closed:
+            self.flush()
+        return self._raw.hash_obj.hexdigest()
 
-    return hash_obj.hexdigest()
+
+# Characters not allowed in file names (Windows + Unix)
+_INVALID_CHARS_RE = re.compile(r'[/\\:*?"<>|]')
+
+
+@functools.lru_cache(maxsize=8)
+def _repeated_replacement_re(replacement: str) -> re.Pattern:
+    """Compiled pattern matching runs of replacement (cached per replacement)."""
+    return re.compile(f'{re.escape(replacement)}+')
 
 
 def sanitise_filename(name: str, replacement: str = '_') -> str:
@@ -52,11 +84,10 @@ def sanitise_filename(name: str, replacement: str = '_') -> str:
 
     # Replace invalid characters (Windows + Unix)
     # Invalid: / \ : * ? " < > |
-    invalid_chars = r'[/\\:*?"<>|]'
-    name = re.sub(invalid_chars, replacement, name)
+    name = _INVALID_CHARS_RE.sub(replacement, name)
 
     # Collapse multiple replacements
-    name = re.sub(f'{re.escape(replacement)}+', replacement, name)
+    name = _repeated_replacement_re(replacement).sub(replacement, name)
 
     # Remove leading/trailing replacements
     name = name.strip(replacement)
@@ -159,6 +190,10 @@ def validate_file_size(file_path: Path, max_size_mb: int) -> None:
 # Cell Address Utilities
 # ============================================================================
 
+# Letters that can start a cell address (the column part)
+_COLUMN_LETTERS = string.ascii_uppercase
+
+
 def sort_key_for_cell_address(address: str) -> tuple:
     """
     Generate a sort key for cell addresses (row-major order).
@@ -174,19 +209,18 @@ def sort_key_for_cell_address(address: str) -> tuple:
         address = address.split('!')[-1]
 
     # Remove dollar signs (absolute references)
-    address = address.replace('$', '')
+    address = address.replace('$', '').upper()
 
-    # Parse column letters and row number
-    match = re.match(r'^([A-Z]+)(\d+)$', address.upper())
-    if not match:
+    # Split column letters from row number (lstrip scans in C, no regex)
+    row_num = address.lstrip(_COLUMN_LETTERS)
+    col_letters = address[:len(address) - len(row_num)]
+    if not col_letters or not row_num.isdecimal():
         return (0, 0)
 
-    col_letters, row_num = match.groups()
-
     # Convert column letters to number (A=1, B=2, ..., Z=26, AA=27, etc.)
     col_num = 0
-    for char in col_letters:
-        col_num = col_num * 26 + (ord(char) - ord('A') + 1)
+    for code in col_letters.encode('ascii'):
+        col_num = col_num * 26 + (code - 64)  # ord('A') == 65
 
     return (int(row_num), col_num)
 
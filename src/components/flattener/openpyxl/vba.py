@@ -4,8 +4,12 @@ VBA macro extraction from Excel workbooks.
 Uses oletools to extract VBA code, including from password-protected macros.
 """
 import logging
+import re
+import zipfile
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from .utils import HashingTextWriter
 
 try:
     from oletools.olevba import VBA_Parser
@@ -16,6 +20,12 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Signature at the start of every OLE compound file (vbaProject.bin is one)
+_OLE_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+# Characters not allowed in VBA module file names
+_INVALID_FILENAME_CHARS = re.compile(r'[/\\:*?"<>|]')
+
 
 def extract_vba(file_path: Path) -> Optional[Dict[str, any]]:
     """
@@ -40,8 +50,17 @@ def extract_vba(file_path: Path) -> Optional[Dict[str, any]]:
 
     logger.debug(f"Extracting VBA from: {file_path}")
 
+    # Zip-based workbooks keep macros in a vbaProject.bin part; when there is
+    # none (every plain .xlsx) there is nothing for oletools to find
+    is_zip, vba_project = _read_vba_project(file_path)
+    if is_zip and vba_project is None:
+        logger.info("✓ No VBA project in workbook")
+        return None
+
     try:
-        vba_parser = VBA_Parser(str(file_path))
+        # Hand oletools the project bytes so it does not reopen the archive;
+        # non-zip files (legacy .xls) are still opened by oletools itself
+        vba_parser = VBA_Parser(str(file_path), data=vba_project)
 
         # Check if macros exist
         if not vba_parser.detect_vba_macros():
@@ -81,6 +100,34 @@ def extract_vba(file_path: Path) -> Optional[Dict[str, any]]:
         return None
 
 
+def _read_vba_project(file_path: Path) -> Tuple[bool, Optional[bytes]]:
+    """
+    Read the vbaProject.bin part of a zip-based workbook.
+
+    Opens the archive once: the central directory tells whether a VBA project
+    exists, and if so its bytes are returned for oletools to parse.
+
+    Args:
+        file_path: Path to Excel file
+
+    Returns:
+        Tuple of (is_zip, vbaProject.bin contents or None if there is no
+        OLE project part). Non-zip files (e.g. legacy .xls) return
+        (False, None).
+    """
+    try:
+        with zipfile.ZipFile(file_path) as zf:
+            for name in zf.namelist():
+                if name.lower().endswith('vbaproject.bin'):
+                    data = zf.read(name)
+                    # Only OLE containers hold VBA (oletools skips anything else)
+                    if data.startswith(_OLE_MAGIC):
+                        return True, data
+            return True, None
+    except zipfile.BadZipFile:
+        return False, None
+
+
 def write_vba_files(vba_info: Dict[str, any], output_dir: Path) -> List[Path]:
     """
     Write VBA modules to separate files.
@@ -126,7 +173,7 @@ def write_vba_files(vba_info: Dict[str, any], output_dir: Path) -> List[Path]:
     return created_files
 
 
-def write_vba_summary(vba_info: Dict[str, any], output_path: Path) -> None:
+def write_vba_summary(vba_info: Dict[str, any], output_path: Path) -> Optional[str]:
     """
     Write VBA summary file.
 
@@ -135,13 +182,16 @@ def write_vba_summary(vba_info: Dict[str, any], output_path: Path) -> None:
     Args:
         vba_info: VBA information dictionary
         output_path: Path to summary file
+
+    Returns:
+        SHA256 hash of the written file (None if there is no VBA info)
     """
     if not vba_info:
-        return
+        return None
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with HashingTextWriter(output_path) as f:
         f.write('# VBA Macros Summary\n')
         f.write('# ==================\n\n')
 
@@ -157,6 +207,8 @@ def write_vba_summary(vba_info: Dict[str, any], output_path: Path) -> None:
 
     logger.debug(f"Wrote VBA summary: {output_path}")
 
+    return f.hexdigest()
+
 
 def _sanitise_filename(filename: str) -> str:
     """
@@ -169,24 +221,10 @@ def _sanitise_filename(filename: str) -> str:
         Sanitised filename
     """
     # Replace problematic characters
-    replacements = {
-        '/': '_',
-        '\\': '_',
-        ':': '_',
-        '*': '_',
-        '?': '_',
-        '"': '_',
-        '<': '_',
-        '>': '_',
-        '|': '_',
-    }
-
-    sanitised = filename
-    for char, replacement in replacements.items():
-        sanitised = sanitised.replace(char, replacement)
+    sanitised = _INVALID_FILENAME_CHARS.sub('_', filename)
 
     # Remove leading/trailing spaces and dots
-    sanitised = sanitised.strip(). strip('.')
+    sanitised = sanitised.strip().strip('.')
 
     # Ensure not empty
     if not sanitised:
@@ -9,6 +9,8 @@ from typing import Dict, Any, List
 
 from openpyxl.workbook import Workbook
 
+from .utils import HashingTextWriter
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,7 +48,7 @@ def extract_structure(wb: Workbook) -> List[Dict[str, Any]]:
     return structure
 
 
-def write_structure_file(structure: List[Dict[str, Any]], output_path: Path) -> None:
+def write_structure_file(structure: List[Dict[str, Any]], output_path: Path) -> str:
     """
     Write structure information to a text file.
 
@@ -63,10 +65,13 @@ def write_structure_file(structure: List[Dict[str, Any]], output_path: Path) ->
     Args:
         structure: List of sheet structure dictionaries
         output_path: Path to output file
+
+    Returns:
+        SHA256 hash of the written file
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with HashingTextWriter(output_path) as f:
         f.write('# Workbook Structure\n')
         f.write('# ' + '=' * 50 + '\n\n')
 
@@ -83,6 +88,8 @@ def write_structure_file(structure: List[Dict[str, Any]], output_path: Path) ->
 
     logger.debug(f"Wrote structure to: {output_path}")
 
+    return f.hexdigest()
+
 
 def _get_tab_color(ws) -> str:
     """
@@ -6,6 +6,8 @@ State management handled by StateManager.
 """
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional
@@ -16,6 +18,7 @@ from src.interfaces import (
     DownloadResult
 )
 from src.utils.bitbucket_client import BitbucketClient
+from src.utils.file_utils import PathMatcher
 
 
 logger = logging.getLogger(__name__)
@@ -40,6 +43,9 @@ class BitbucketSource(SourceInterface):
                 - exclude_patterns: List of glob patterns to exclude (optional)
                 - depth: Number of commits to process initially (optional, default: 1)
                 - download_dir: Directory where files will be downloaded (optional, default: ./tmp/downloads)
+                - max_workers: Concurrent API requests when listing changes (optional, default: 8)
+                - head_cache_ttl: Seconds get_current_version reuses the branch head
+                  it last fetched (optional, default: 30; 0 disables)
         """
         super().__init__(config)
         self.url = config['url']
@@ -48,11 +54,24 @@ class BitbucketSource(SourceInterface):
         self.exclude_patterns = config.get('exclude_patterns', [])
         self.depth = config.get('depth', 1)
         self.download_dir = Path(config.get('download_dir', './tmp/downloads'))
+        self.max_workers = config.get('max_workers', 8)
+        self.head_cache_ttl = config.get('head_cache_ttl', 30)
+
+        # Last branch head from get_current_version and when it was fetched
+        self._head_cache: Optional[str] = None
+        self._head_cache_time = 0.0
+
+        # Patterns compiled once; matching follows Path.match semantics
+        self._include_matcher = PathMatcher(self.include_patterns)
+        self._exclude_matcher = PathMatcher(self.exclude_patterns)
 
         # Initialize client - it gets token from environment automatically
         self.client = BitbucketClient(base_url=self.url)
 
-        logger.info(f"Initialized BitbucketSource for {self.url} (branch: {self.branch}, download_dir: {self.download_dir})")
+        logger.info(
+            "Initialized BitbucketSource for %s (branch: %s, download_dir: %s)",
+            self.url, self.branch, self.download_dir
+        )
 
     def get_changed_files(
         self,
@@ -73,29 +92,24 @@ class BitbucketSource(SourceInterface):
                 return []
 
             # Get commits using client
-            # Fetch more commits than depth to ensure we get enough after filtering
-            limit = 10 if since_version else self.depth
-            data = self.client.get_commits(branch=self.branch, limit=limit)
-
-            all_commits = data.get('values', [])
-            if not all_commits:
-                logger.info("No commits found")
-                return []
-
-            # Filter commits by timestamp if since_version is provided
-            commits = []
             if since_version:
-                logger.info(f"Filtering commits since timestamp {since_version}")
-                since_timestamp = int(since_version)
-                for commit in all_commits:
-                    commit_timestamp = int(commit['authorTimestamp'])
-                    if commit_timestamp > since_timestamp:
-                        commits.append(commit)
-                logger.info(f"Found {len(commits)} commits after timestamp {since_version}")
+                # Only commits after that timestamp - paging stops at the first older one
+                logger.info("Fetching commits since timestamp %s", since_version)
+                commits = self.client.get_commits_since(
+                    branch=self.branch,
+                    since_timestamp=int(since_version)
+                )
+                logger.info("Found %d commits after timestamp %s", len(commits), since_version)
             else:
+                data = self.client.get_commits(branch=self.branch, limit=self.depth)
+                all_commits = data.get('values', [])
+                if not all_commits:
+                    logger.info("No commits found")
+                    return []
+
                 # Just use the first N commits (depth)
                 commits = all_commits[:self.depth]
-                logger.info(f"Processing last {len(commits)} commit(s)")
+                logger.info("Processing last %d commit(s)", len(commits))
 
             # Reverse to process EARLIEST-FIRST (Monday → Tuesday → Wednesday)
             # This ensures chronological ordering for diffs
@@ -108,54 +122,63 @@ class BitbucketSource(SourceInterface):
             # Collect changed files from all commits
             changed_files = {}  # path -> SourceFileInfo (deduplicate by path)
 
-            for commit in commits:
+            # Fetch each commit's changes concurrently over the pooled session;
+            # results come back in commit order so deduplication is unchanged
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(commits))) as executor:
+                all_changes = list(executor.map(self._fetch_commit_changes, commits))
+
+            for commit, changes in zip(commits, all_changes):
+                if changes is None:
+                    continue
+
                 commit_id = commit['id']
                 commit_timestamp = commit['authorTimestamp']
                 commit_date = datetime.fromtimestamp(commit_timestamp / 1000)  # Convert ms to seconds
 
-                logger.debug(f"Processing commit {commit['message'][:50]}")
+                logger.debug("Processing commit %.50s", commit['message'])
 
-                # Get files changed in this commit
                 try:
-                    changes = self.client.get_commit_changes(commit_id)
-
                     for change in changes.get('values', []):
                         file_path = change['path']['toString']
                         # Normalize path separators (convert Windows \ to /)
                         file_path = file_path.replace('\\', '/')
-                        path_obj = Path(file_path)
-
-                        # Check if file matches include patterns
-                        included = any(path_obj.match(pattern) for pattern in self.include_patterns)
-                        if not included:
-                            continue
 
-                        # Check if file matches exclude patterns
-                        excluded = any(path_obj.match(pattern) for pattern in self.exclude_patterns)
-                        if excluded:
+                        if not self._matches_patterns(file_path):
                             continue
 
                         # Add to changed files (use latest version if file appears in multiple commits)
                         if file_path not in changed_files:
                             changed_files[file_path] = SourceFileInfo(
-                                path=path_obj,
+                                path=Path(file_path),
                                 version=str(commit_timestamp),  # Use timestamp as version
                                 version_date=commit_date,
                                 status='modified'
                             )
-                            logger.debug(f"Found changed file: {file_path}")
+                            logger.debug("Found changed file: %s", file_path)
 
                 except Exception as e:
-                    logger.warning(f"Error getting changes for commit {commit_id}: {e}")
+                    logger.warning("Error getting changes for commit %s: %s", commit_id, e)
                     continue
 
-            logger.info(f"Found {len(changed_files)} changed file(s) matching patterns")
+            logger.info("Found %d changed file(s) matching patterns", len(changed_files))
             return list(changed_files.values())
 
         except Exception as e:
-            logger.error(f"Error fetching commits: {e}")
+            logger.error("Error fetching commits: %s", e)
             return []
 
+    def _matches_patterns(self, file_path: str) -> bool:
+        """Check file_path against include patterns, then exclude patterns."""
+        return self._include_matcher(file_path) and not self._exclude_matcher(file_path)
+
+    def _fetch_commit_changes(self, commit: dict) -> Optional[dict]:
+        """Get files changed in a commit, or None if the request failed."""
+        try:
+            return self.client.get_commit_changes(commit['id'])
+        except Exception as e:
+            logger.warning("Error getting changes for commit %s: %s", commit['id'], e)
+            return None
+
     def download_file(
         self,
         source_path: str,
@@ -164,20 +187,20 @@ class BitbucketSource(SourceInterface):
     ) -> DownloadResult:
         """Download file from Bitbucket at specific commit."""
         try:
-            logger.info(f"Downloading {source_path} at version {version}")
-
-            # Download using client (use branch name as ref for now)
-            source_path_normanalised = source_path.replace('\\', '/')
-            content = self.client.get_file(path=source_path_normanalised, ref=self.branch)
+            logger.info("Downloading %s at version %s", source_path, version)
 
             # Create parent directory if needed
             local_dest.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write file
-            with open(local_dest, 'wb') as f:
-                f.write(content)
+            # Stream straight to disk using client (use branch name as ref for now)
+            source_path_normanalised = source_path.replace('\\', '/')
+            size = self.client.download_file(
+                path=source_path_normanalised,
+                ref=self.branch,
+                local_path=local_dest
+            )
 
-            logger.info(f"Successfully downloaded {local_dest} ({len(content)} bytes)")
+            logger.info("Successfully downloaded %s (%d bytes)", local_dest, size)
 
             return DownloadResult(
                 success=True,
@@ -188,7 +211,7 @@ class BitbucketSource(SourceInterface):
             )
 
         except Exception as e:
-            logger.error(f"Error downloading {source_path}: {e}")
+            logger.error("Error downloading %s: %s", source_path, e)
             return DownloadResult(
                 success=False,
                 source_path=source_path,
@@ -198,13 +221,23 @@ class BitbucketSource(SourceInterface):
             )
 
     def get_current_version(self) -> str:
-        """Get current version identifier (latest commit timestamp on branch)."""
+        """
+        Get current version identifier (latest commit timestamp on branch).
+
+        Repeat calls within head_cache_ttl seconds reuse the last answer
+        instead of asking the server again.
+        """
+        if self._head_cache is not None and time.monotonic() - self._head_cache_time < self.head_cache_ttl:
+            return self._head_cache
+
         try:
             commit_timestamp = self.client.get_branch_head_timestamp(self.branch)
-            logger.debug(f"Current version: {commit_timestamp}")
+            logger.debug("Current version: %s", commit_timestamp)
+            self._head_cache = commit_timestamp
+            self._head_cache_time = time.monotonic()
             return commit_timestamp
         except Exception as e:
-            logger.error(f"Error getting current version: {e}")
+            logger.error("Error getting current version: %s", e)
             # Return timestamp as fallback
             return datetime.now().isoformat()
 
@@ -6,17 +6,18 @@ Tracks changes using file modification timestamps.
 State management handled by StateManager.
 """
 
+import os
 import shutil
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional
-from fnmatch import fnmatch
 
 from src.interfaces import (
     SourceInterface,
     SourceFileInfo,
     DownloadResult
 )
+from src.utils.file_utils import PathMatcher, iter_files
 
 
 class LocalSource(SourceInterface):
@@ -42,6 +43,10 @@ class LocalSource(SourceInterface):
         self.include_patterns = config.get('include_patterns', ['*.xlsx', '*.xlsm', '**/*.xlsx', '**/*.xlsm'])
         self.exclude_patterns = config.get('exclude_patterns', [])
 
+        # Patterns compiled once for the whole scan (Path.match semantics, ** support)
+        self._include_matcher = PathMatcher(self.include_patterns)
+        self._exclude_matcher = PathMatcher(self.exclude_patterns)
+
         if not self.folder_path.exists():
             raise ValueError(f"Source folder does not exist: {self.folder_path}")
 
@@ -68,52 +73,49 @@ class LocalSource(SourceInterface):
             List of SourceFileInfo for matching files
         """
 
+        # Parse since_version once for the whole scan
+        since_date = None
+        if since_version:
+            try:
+                since_date = datetime.fromisoformat(since_version)
+            except (TypeError, ValueError):
+                pass  # Invalid since_version, include files anyway
+
         # Scan folder for files matching patterns
         matching_files = []
 
-        for file_path in self.folder_path.rglob('*'):
-            if not file_path.is_file():
-                continue
+        # Walk with os.scandir; relative paths are sliced off the root, and a
+        # Path is only built for files that match
+        root_len = len(os.path.join(os.fspath(self.folder_path), ''))
 
+        for file_path in iter_files(self.folder_path, include_file_symlinks=True):
             # Get relative path for pattern matching
-            rel_path = file_path.relative_to(self.folder_path)
-            rel_path_str = str(rel_path)
+            rel_path_str = file_path[root_len:]
 
-            # Check include patterns (use Path.match for ** support)
-            included = any(
-                rel_path.match(pattern)
-                for pattern in self.include_patterns
-            )
-
-            if not included:
+            # Check include patterns
+            if not self._include_matcher(rel_path_str):
                 continue
 
-            # Check exclude patterns (use Path.match for ** support)
-            excluded = any(
-                rel_path.match(pattern)
-                for pattern in self.exclude_patterns
-            )
-
-            if excluded:
+            # Check exclude patterns
+            if self._exclude_matcher(rel_path_str):
                 continue
 
             # Get file modification time
-            mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
+            mtime = datetime.fromtimestamp(os.stat(file_path).st_mtime)
             version = mtime.isoformat()
 
             # If since_version specified, check if file is newer
-            if since_version:
+            if since_date is not None:
                 try:
-                    since_date = datetime.fromisoformat(since_version)
                     if mtime <= since_date:
                         continue  # File hasn't changed
-                except:
-                    pass  # Invalid since_version, include file anyway
+                except TypeError:
+                    pass  # Timezone-aware since_version, include file anyway
 
             # Determine status (for local, always 'modified' since we can't track adds/deletes)
             matching_files.append(
                 SourceFileInfo(
-                    path=rel_path,
+                    path=Path(rel_path_str),
                     version=version,
                     version_date=mtime,
                     status='modified'
@@ -58,8 +58,26 @@ class Differ:
                 'success': bool,
                 'errors': List[str]
             }
+
+            If the two files are byte-identical, flattening is skipped and
+            the result has 'identical': True with no differences.
         """
         try:
+            # Identical inputs cannot differ - skip both flattens
+            if filecmp.cmp(file1, file2, shallow=False):
+                return {
+                    'file1': file1.name,
+                    'file2': file2.name,
+                    'identical': True,
+                    'files_compared': 0,
+                    'files_different': 0,
+                    'files_only_in_file1': [],
+                    'files_only_in_file2': [],
+                    'differences': [],
+                    'success': True,
+                    'errors': []
+                }
+
             # Flatten both files
             result1 = self.flattener.flatten(file1)
             result2 = self.flattener.flatten(file2)
@@ -4,6 +4,7 @@ JSON Formatter for diff results
 Formats diff results as JSON for programmatic consumption.
 """
 
+import gzip
 import json
 from typing import Dict, Any
 
@@ -31,12 +32,20 @@ class JSONFormatter:
         """
         Save diff result to JSON file.
 
+        If output_path ends with '.gz' the JSON is gzip-compressed on the way
+        out - diff output for large workbooks is very repetitive text.
+
         Args:
             diff_result: Diff result dictionary from Differ
-            output_path: Path where to save JSON file
+            output_path: Path where to save JSON file (.json or .json.gz)
             pretty: If True, format with indentation
         """
-        with open(output_path, 'w', encoding='utf-8') as f:
+        if str(output_path).endswith('.gz'):
+            f = gzip.open(output_path, 'wt', encoding='utf-8', compresslevel=6)
+        else:
+            f = open(output_path, 'w', encoding='utf-8')
+
+        with f:
             if pretty:
                 json.dump(diff_result, f, indent=2)
             else:
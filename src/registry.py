@@ -176,6 +176,13 @@ def register_all_components():
     except (ImportError, RuntimeError):
         windows_converter_available = False
 
+    # Import pure-Python xlsb converter (optional pyxlsb dependency)
+    try:
+        from src.components.converter.pyxlsb_converter import PyxlsbConverter
+        pyxlsb_converter_available = True
+    except ImportError:
+        pyxlsb_converter_available = False
+
     # Register sources
     registry.register_source('local_folder', LocalSource)
     registry.register_source('bitbucket', BitbucketSource)
@@ -188,6 +195,8 @@ def register_all_components():
     registry.register_converter('noop', NoOpConverter)
     if windows_converter_available:
         registry.register_converter('windows_excel', WindowsExcelConverter)
+    if pyxlsb_converter_available:
+        registry.register_converter('pyxlsb', PyxlsbConverter)
 
     # Register flatteners
     registry.register_flattener('noop', NoOpFlattener)
@@ -1,7 +1,36 @@
 """Minimal Bitbucket HTTP client - inserts token into URL for authentication."""
 
+import functools
+import json
 import os
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Connection pool size per host - sized for concurrent file downloads
+POOL_SIZE = 32
+
+# Items requested per page from paged endpoints (server default is 25)
+PAGE_SIZE = 500
+
+# Chunk size when streaming file downloads
+DOWNLOAD_CHUNK = 1 << 20
+
+# Max commit listings kept for ETag revalidation (held in memory; raw file
+# bodies are never cached - they stream through download_file)
+ETAG_CACHE_SIZE = 64
 
 
 def get_token_from_env(env_var: str = 'BITBUCKET_TOKEN') -> str:
@@ -23,6 +52,23 @@ def get_token_from_env(env_var: str = 'BITBUCKET_TOKEN') -> str:
     return token
 
 
+def _parse_json(response: requests.Response):
+    """Decode a JSON response body (orjson when installed, else stdlib json)."""
+    return _loads(response.content)
+
+
+def _loads(content: bytes):
+    """Decode JSON bytes (orjson when installed, else stdlib json)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _committed_at(commit: dict) -> int:
+    """Committer timestamp (ms) of a commit, falling back to the author timestamp."""
+    return int(commit.get('committerTimestamp') or commit['authorTimestamp'])
+
+
 class BitbucketClient:
     """
     Minimal Bitbucket client for Bitbucket Data Center/Server.
@@ -41,30 +87,219 @@ class BitbucketClient:
 
         self.base_url = base_url.rstrip('/')
 
+        # Endpoint prefixes built once - methods only append the variable part
+        self._commits_url = f"{self.base_url}/commits"
+        self._raw_url = f"{self.base_url}/raw"
+        self._browse_url = f"{self.base_url}/browse"
+
+        # One pooled session for all calls: keep-alive connections are reused
+        # and transient 429/5xx responses on reads are retried with backoff.
+        # Uploads (PUT) are not retried - each PUT creates a commit.
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET', 'HEAD'],
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Authorization': f'Bearer {self.token}',
+            'Accept': 'application/json',
+            # gzip/deflate, plus br/zstd when their decoders are installed
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'User-Agent': 'excel-differ/1.0'
+        })
+
+        # Commit listings: key -> (etag, raw JSON bytes); oldest entries evicted
+        # first. Bytes are parsed on every hit so callers get their own objects
+        self._etag_cache = OrderedDict()
+        self._etag_lock = threading.Lock()
+
+        # A commit's change list never changes - cache per client instance
+        self._cached_commit_changes = functools.lru_cache(maxsize=256)(self._fetch_commit_changes)
+
+    def close(self) -> None:
+        """Close pooled connections. The client should not be used afterwards."""
+        self.session.close()
+
+    def __enter__(self) -> 'BitbucketClient':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _cache_get(self, key):
+        """Return cached (etag, body) for key, or None."""
+        with self._etag_lock:
+            entry = self._etag_cache.get(key)
+            if entry is not None:
+                self._etag_cache.move_to_end(key)
+            return entry
+
+    def _cache_put(self, key, etag, body) -> None:
+        """Store (etag, body) for key, evicting the oldest entry when full."""
+        if not etag:
+            return
+        with self._etag_lock:
+            self._etag_cache[key] = (etag, body)
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+
+    def _paginate(self, url: str, params: dict = None) -> list:
+        """
+        Fetch every page of a paged Data Center endpoint.
+
+        Pages are linked by isLastPage/nextPageStart, so the next page is only
+        known once the current one arrives - pages are fetched in order.
+
+        Returns:
+            All 'values' items across pages
+        """
+        params = dict(params or {})
+        params['limit'] = PAGE_SIZE
+        values = []
+        while True:
+            response = self.session.get(url, params=params)
+            response.raise_for_status()
+            page = _parse_json(response)
+            values.extend(page.get('values', []))
+            if page.get('isLastPage', True) or page.get('nextPageStart') is None:
+                return values
+            params['start'] = page['nextPageStart']
+
     def get_commits(self, branch: str, limit: int = 20) -> dict:
         """Get commits for a branch."""
-        url = f"{self.base_url}/commits"
+        url = self._commits_url
         params = {'until': f'refs/heads/{branch}'}
         if limit:
             params['limit'] = limit
 
-        response = requests.get(url, params=params, headers={'Authorization': f'Bearer {self.token}'})
+        # Revalidate a previous listing - 304 means the branch has not moved
+        key = ('commits', branch, limit)
+        cached = self._cache_get(key)
+        headers = {'If-None-Match': cached[0]} if cached else None
+
+        response = self.session.get(url, params=params, headers=headers)
         response.raise_for_status()
-        return response.json()
+        if response.status_code == 304 and cached:
+            return _loads(cached[1])
+
+        self._cache_put(key, response.headers.get('ETag'), response.content)
+        return _parse_json(response)
+
+    def get_commits_since(self, branch: str, since_timestamp: int, page_size: int = 50) -> list:
+        """
+        Get commits on a branch authored after since_timestamp (ms), newest first.
+
+        Author dates are not in history order (rebased and cherry-picked
+        commits keep theirs), so every listed commit is filtered on its author
+        date, and paging stops on the committer date instead, which those
+        operations reset. The branch head is checked first (one request,
+        ETag-cached), so a poll with nothing new costs a single call.
+        Otherwise pages are fetched only until the first commit committed at
+        or before since_timestamp.
+        """
+        head = self.get_commits(branch, limit=1).get('values', [])
+        if not head or _committed_at(head[0]) <= since_timestamp:
+            return []
+
+        params = {'until': f'refs/heads/{branch}', 'limit': page_size}
+        commits = []
+        while True:
+            response = self.session.get(self._commits_url, params=params)
+            response.raise_for_status()
+            page = _parse_json(response)
+            for commit in page.get('values', []):
+                if _committed_at(commit) <= since_timestamp:
+                    return commits
+                if int(commit['authorTimestamp']) > since_timestamp:
+                    commits.append(commit)
+            if page.get('isLastPage', True) or page.get('nextPageStart') is None:
+                return commits
+            params['start'] = page['nextPageStart']
 
     def get_commit_changes(self, commit_id: str) -> dict:
-        """Get files changed in a specific commit."""
-        url = f"{self.base_url}/commits/{commit_id}/changes"
-        response = requests.get(url, headers={'Authorization': f'Bearer {self.token}'})
-        response.raise_for_status()
-        return response.json()
+        """Get all files changed in a specific commit (every page, cached)."""
+        return self._cached_commit_changes(commit_id)
+
+    def _fetch_commit_changes(self, commit_id: str) -> dict:
+        """Fetch a commit's change list from the server."""
+        url = f"{self._commits_url}/{commit_id}/changes"
+        return {'values': self._paginate(url)}
+
+    def _get_raw(self, path: str, ref: str) -> requests.Response:
+        """Open a streamed response for a raw file at specific commit."""
+        url = f"{self._raw_url}/{path}"
+        # Workbooks are already zip-compressed - ask for the bytes as stored
+        headers = {'Accept': '*/*', 'Accept-Encoding': 'identity'}
+        response = self.session.get(url, params={'at': ref}, headers=headers, stream=True)
+        try:
+            response.raise_for_status()
+        except Exception:
+            response.close()
+            raise
+        return response
 
     def get_file(self, path: str, ref: str) -> bytes:
-        """Download file content at specific commit."""
-        url = f"{self.base_url}/raw/{path}"
-        response = requests.get(url, params={'at': ref}, headers={'Authorization': f'Bearer {self.token}'})
-        response.raise_for_status()
-        return response.content
+        """
+        Download file content at specific commit.
+
+        The content is not cached: workbooks can be hundreds of MB, so keeping
+        them for the client's lifetime would hold that memory indefinitely.
+        Use download_file to stream large files to disk instead.
+        """
+        buf = bytearray()
+        with self._get_raw(path, ref) as response:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK):
+                buf += chunk
+        return bytes(buf)
+
+    def get_files(self, paths: list, ref: str, max_workers: int = 8) -> tuple:
+        """
+        Download several files at one ref concurrently.
+
+        Requests share the session's connection pool, so max_workers is
+        capped at the pool size. A failing path does not stop the others.
+
+        Returns:
+            Tuple of ({path: content}, {path: error message})
+        """
+        def fetch(path):
+            try:
+                return path, self.get_file(path, ref), None
+            except Exception as e:
+                return path, None, str(e)
+
+        contents = {}
+        errors = {}
+        workers = max(1, min(max_workers, POOL_SIZE, len(paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for path, content, error in executor.map(fetch, paths):
+                if error is None:
+                    contents[path] = content
+                else:
+                    errors[path] = error
+        return contents, errors
+
+    def download_file(self, path: str, ref: str, local_path: Path) -> int:
+        """
+        Stream file content at specific commit straight to disk.
+
+        The file is never held in memory as a whole.
+
+        Returns:
+            Number of bytes written
+        """
+        with self._get_raw(path, ref) as response:
+            response.raw.decode_content = True
+            with open(local_path, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK)
+                return f.tell()
 
     def get_branch_head_timestamp(self, branch: str) -> str:
         """Get latest commit timestamp for branch."""
@@ -75,30 +310,36 @@ class BitbucketClient:
         """
         Upload files to repository.
 
+        Each file is a separate PUT to the browse endpoint and so becomes its
+        own commit - Data Center has no multi-file commit endpoint.
+
         Args:
             branch: Branch name
-            files: Dict of {repo_path: content}
+            files: Dict of {repo_path: content}, or an iterable of
+                (repo_path, content) pairs (consumed lazily, so a generator
+                can produce files while earlier ones upload). Content is bytes,
+                an open binary file, or a Path (opened only while it is
+                uploaded, so a batch never holds more than one file in memory)
             message: Commit message
 
         Returns:
             Response JSON from last upload
         """
         result = None
-        for file_path, content in files.items():
-            url = f"{self.base_url}/browse/{file_path}"
+        items = files.items() if isinstance(files, dict) else files
+        for file_path, content in items:
+            url = f"{self._browse_url}/{file_path}"
             data = {
                 'message': message,
                 'branch': branch
             }
-            files_param = {'content': content}
-
-            response = requests.put(
-                url,
-                data=data,
-                files=files_param,
-                headers={'Authorization': f'Bearer {self.token}'}
-            )
+
+            if isinstance(content, Path):
+                with open(content, 'rb') as f:
+                    response = self.session.put(url, data=data, files={'content': (content.name, f)})
+            else:
+                response = self.session.put(url, data=data, files={'content': content})
             response.raise_for_status()
-            result = response.json()
+            result = _parse_json(response)
 
         return result if result else {}
@@ -0,0 +1,183 @@
+"""File system helpers shared by sources and destinations."""
+
+import fnmatch
+import os
+import re
+import shutil
+from pathlib import Path, PurePath
+from typing import Iterable, Iterator, Tuple, Union
+
+
+def iter_files(root: Union[str, Path], include_file_symlinks: bool = False) -> Iterator[str]:
+    """
+    Yield the path of every regular file under root (recursive).
+
+    Uses os.scandir, whose entries carry the file type from the directory
+    listing, so no per-entry stat or Path object is needed. Symlinks are not
+    followed.
+
+    Args:
+        root: Directory to walk
+        include_file_symlinks: Also yield symlinks that point to regular files
+            (as Path.rglob does); symlinked directories are still not entered
+
+    Yields:
+        File paths as strings (root joined with the relative path)
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=include_file_symlinks):
+                    yield entry.path
+
+
+def iter_tree(root: Union[str, Path], follow_symlinks: bool = False) -> Iterator[Tuple[str, bool]]:
+    """
+    Yield every directory and regular file under root (recursive).
+
+    Like iter_files, but directories (including empty ones) are yielded too,
+    each before anything inside it.
+
+    Args:
+        root: Directory to walk
+        follow_symlinks: Treat symlinks as what they point to - symlinked files
+            are yielded as files and symlinked directories are walked (as
+            shutil.copytree does by default). A symlink to a directory that
+            is already being walked (a cycle) is skipped
+
+    Yields:
+        (path, is_dir) tuples, paths as strings (root joined with the relative path)
+    """
+    root = os.fspath(root)
+    # (st_dev, st_ino) of the directories enclosing each path - only needed
+    # to detect cycles when symlinks are followed
+    ancestors = frozenset()
+    if follow_symlinks:
+        st = os.stat(root)
+        ancestors = frozenset({(st.st_dev, st.st_ino)})
+
+    stack = [(root, ancestors)]
+    while stack:
+        path, ancestors = stack.pop()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    if follow_symlinks:
+                        st = os.stat(entry.path)
+                        key = (st.st_dev, st.st_ino)
+                        if key in ancestors:
+                            continue  # Links back to an enclosing directory
+                        stack.append((entry.path, ancestors | {key}))
+                    else:
+                        stack.append((entry.path, ancestors))
+                    yield entry.path, True
+                elif entry.is_file(follow_symlinks=follow_symlinks):
+                    yield entry.path, False
+
+
+def copy_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """
+    Copy a file's contents and metadata (same result as shutil.copy2).
+
+    Tries os.copy_file_range first, which copies inside the kernel and can
+    reflink on copy-on-write filesystems. Falls back to shutil.copyfile, which
+    itself uses sendfile on Linux and fcopyfile on macOS.
+
+    Args:
+        src: Source file
+        dst: Destination file path (not a directory)
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass  # Not supported here (e.g. cross-device, old kernel) - fall back
+
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+class PathMatcher:
+    """
+    Match paths against glob patterns with the semantics of PurePath.match.
+
+    Patterns are parsed and compiled once, and a path is split once per call
+    rather than once per pattern. Relative patterns match from the right,
+    one path segment per pattern segment (so '**/*.xlsx' needs at least one
+    directory, exactly like Path.match). Case sensitivity follows the
+    platform's path flavour. Absolute patterns and absolute paths go through
+    PurePath.match itself.
+
+    Example:
+        matcher = PathMatcher(['**/*.xlsx', '*.xlsm'])
+        matcher('reports/q1.xlsx')  # True
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Compile patterns.
+
+        Args:
+            patterns: Glob patterns (any one matching is a match)
+        """
+        self.patterns = list(patterns)
+        self._case_sensitive = os.name != 'nt'
+
+        # Per relative pattern: match functions for its segments, last segment first
+        self._compiled = []
+        # Anchored or empty patterns, left to PurePath.match
+        self._fallback = []
+
+        for pattern in self.patterns:
+            parts = PurePath(pattern).parts
+            if not parts or PurePath(pattern).anchor:
+                self._fallback.append(pattern)
+                continue
+            if not self._case_sensitive:
+                parts = [part.lower() for part in parts]
+            self._compiled.append(
+                [re.compile(fnmatch.translate(part)).match for part in reversed(parts)]
+            )
+
+    def __call__(self, path: str) -> bool:
+        """
+        Check whether path matches any of the patterns.
+
+        Args:
+            path: Path using '/' separators (or the platform separator)
+
+        Returns:
+            True if at least one pattern matches
+        """
+        if path[:1] in ('/', '\\') or path[1:2] == ':':
+            # Anchored paths are rare here - let PurePath handle roots and drives
+            pure_path = PurePath(path)
+            return any(pure_path.match(pattern) for pattern in self.patterns)
+
+        normalised = path
+        if not self._case_sensitive:
+            normalised = normalised.lower().replace('\\', '/')
+        parts = [part for part in normalised.split('/') if part and part != '.']
+        parts.reverse()
+        count = len(parts)
+
+        for matchers in self._compiled:
+            if len(matchers) <= count and all(match(part) for match, part in zip(matchers, parts)):
+                return True
+
+        if self._fallback:
+            pure_path = PurePath(path)
+            return any(pure_path.match(pattern) for pattern in self._fallback)
+        return False
@@ -0,0 +1,118 @@
+"""
+File hashing shared by the flattener and destinations.
+
+SHA256 of file contents, with a per-process cache for files that have not
+changed since they were last hashed.
+"""
+import functools
+import hashlib
+import logging
+import mmap
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+# Files larger than this are hashed through mmap
+MMAP_HASH_THRESHOLD = 4 * 1024 * 1024
+
+# Read size for the chunked fallback in get_file_hash
+_HASH_CHUNK = 1 << 20
+
+# hashlib.file_digest was added in Python 3.11
+_file_digest = getattr(hashlib, 'file_digest', None)
+
+# Hashes of files already seen: {(path, algorithm, inode, size, mtime_ns): hex}
+HASH_CACHE_SIZE = 1024
+
+# Files modified less than this long ago are not cached: on filesystems with
+# coarse mtimes (FAT: 2 s, some SMB and container mounts) an in-place rewrite
+# of the same size could otherwise keep the same cache key
+HASH_CACHE_MIN_AGE_NS = 5 * 1_000_000_000
+_hash_cache: Dict[tuple, str] = {}
+_hash_cache_lock = threading.Lock()
+
+
+def new_hash(algorithm: str = 'sha256'):
+    """
+    Create a hash object for file fingerprinting.
+
+    usedforsecurity=False: these hashes identify content, they do not protect
+    anything, so FIPS-restricted builds must not refuse them.
+    """
+    return hashlib.new(algorithm, usedforsecurity=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _log_hash_backend() -> None:
+    """Log once which SHA-256 implementation this interpreter uses."""
+    if hashlib.sha256.__module__ == '_hashlib':
+        # OpenSSL uses the CPU's SHA extensions (SHA-NI, ARMv8 SHA2) when present
+        logger.debug("SHA-256 backend: OpenSSL")
+    else:
+        logger.warning(
+            "SHA-256 backend: Python built-in (no OpenSSL) - file hashing will be slower"
+        )
+
+
+def get_file_hash(file_path: Path, algorithm: str = 'sha256') -> str:
+    """
+    Calculate hash of a file.
+
+    Results are remembered per (path, inode, size, mtime); asking again for
+    a file that has not changed since is a dictionary lookup. Files modified
+    within the last HASH_CACHE_MIN_AGE_NS are always hashed afresh, as their
+    mtime may not yet tell a rewrite apart.
+
+    Files above MMAP_HASH_THRESHOLD are memory-mapped and hashed in a single
+    update (the GIL is released for the whole file); smaller files go through
+    hashlib.file_digest, which reads into a reused buffer (Python 3.11+; older
+    versions read 1 MiB chunks into a reused buffer here).
+
+    Args:
+        file_path: Path to file
+        algorithm: Hash algorithm (default: sha256)
+
+    Returns:
+        Hex string of file hash
+    """
+    _log_hash_backend()
+
+    with open(file_path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        cache_key = (os.fspath(file_path), algorithm, st.st_ino, st.st_size, st.st_mtime_ns)
+        file_hash = _hash_cache.get(cache_key)
+        if file_hash is None:
+            file_hash = _hash_open_file(f, st.st_size, algorithm)
+            if time.time_ns() - st.st_mtime_ns < HASH_CACHE_MIN_AGE_NS:
+                return file_hash  # Too recent to trust the mtime - don't cache
+            with _hash_cache_lock:
+                if len(_hash_cache) >= HASH_CACHE_SIZE:
+                    del _hash_cache[next(iter(_hash_cache))]  # Drop the oldest entry
+                _hash_cache[cache_key] = file_hash
+        return file_hash
+
+
+def _hash_open_file(f, size: int, algorithm: str) -> str:
+    """Hash an open binary file of the given size (see get_file_hash)."""
+    if size > MMAP_HASH_THRESHOLD:
+        hash_obj = new_hash(algorithm)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            hash_obj.update(mm)
+        return hash_obj.hexdigest()
+
+    if _file_digest is not None:
+        return _file_digest(f, functools.partial(new_hash, algorithm)).hexdigest()
+
+    hash_obj = new_hash(algorithm)
+    buffer = bytearray(_HASH_CHUNK)
+    view = memoryview(buffer)
+    while True:
+        size = f.readinto(buffer)
+        if not size:
+            break
+        hash_obj.update(view[:size])
+    return hash_obj.hexdigest()
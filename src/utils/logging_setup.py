@@ -4,11 +4,31 @@ Shared logging setup for Excel Differ.
 Provides colored console logging and detailed file logging for the entire application.
 """
 import logging
+import logging.handlers
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+# File log records are written in batches of this many (WARNING and above at
+# once). Kept small: a hard kill (SIGKILL, os._exit) loses what is buffered
+FILE_LOG_BUFFER_CAPACITY = 64
+
+
+class _BufferingHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that renders each message as it is buffered.
+
+    Records are formatted only when the buffer is flushed; resolving the
+    %-args first means mutable arguments are logged as they were at the
+    logging call, not as they are at flush time.
+    """
+
+    def emit(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        super().emit(record)
+
 
 class ColourFormatter(logging.Formatter):
     """
@@ -25,14 +45,30 @@ class ColourFormatter(logging.Formatter):
         'RESET': '\033[0m',     # Reset
     }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Coloured, padded level names built once: {levelno: text}
+        self._coloured_levels = {
+            getattr(logging, name): f"{colour}{name:<8}{self.COLOURS['RESET']}"
+            for name, colour in self.COLOURS.items()
+            if name != 'RESET'
+        }
+
     def format(self, record):
         """Format log record with colour for console."""
-        # Add colour to level name
+        # Add colour to level name - only for this formatter: the same record
+        # is formatted next by the file handler, which must not see the codes
         levelname = record.levelname
-        if levelname in self.COLOURS:
-            record.levelname = f"{self.COLOURS[levelname]}{levelname:<8}{self.COLOURS['RESET']}"
+        coloured = self._coloured_levels.get(record.levelno)
+        if coloured is None:
+            return super().format(record)
 
-        return super().format(record)
+        record.levelname = coloured
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logging(log_level: str = 'INFO', log_dir: Optional[str] = None, component: str = 'excel-differ'):
@@ -41,7 +77,8 @@ def setup_logging(log_level: str = 'INFO', log_dir: Optional[str] = None, compon
 
     Configures dual output:
     - Console: colored output at specified log level
-    - File: detailed DEBUG output in log file
+    - File: detailed DEBUG output in log file, buffered and written in
+      small batches (immediately on WARNING, and at exit)
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
@@ -55,7 +92,13 @@ def setup_logging(log_level: str = 'INFO', log_dir: Optional[str] = None, compon
     logger = logging.getLogger()
     logger.setLevel(getattr(logging, log_level))
 
-    # Remove existing handlers
+    # Remove existing handlers (closing them writes out any buffered records)
+    for handler in logger.handlers:
+        # MemoryHandler.close() drops its target, so take it first
+        target = getattr(handler, 'target', None)
+        handler.close()
+        if target is not None:
+            target.close()
     logger.handlers = []
 
     # Console handler (with colour)
@@ -86,8 +129,19 @@ def setup_logging(log_level: str = 'INFO', log_dir: Optional[str] = None, compon
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
 
-    logger.info(f"Logging initialised (level: {log_level}, file: {log_file})")
+    # Buffer file records so the log is not written one record at a time;
+    # the console handler stays unbuffered for interactive feedback
+    buffered_handler = _BufferingHandler(
+        capacity=FILE_LOG_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+        flushOnClose=True
+    )
+    logger.addHandler(buffered_handler)
+    # At exit, logging.shutdown() closes handlers newest first: the buffer is
+    # flushed into file_handler before file_handler itself is closed
+
+    logger.info("Logging initialised (level: %s, file: %s)", log_level, log_file)
 
     return logger
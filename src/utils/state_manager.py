@@ -61,6 +61,12 @@ from typing import Optional, Dict
 from dataclasses import dataclass, asdict
 from threading import Lock
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -124,6 +130,7 @@ class StateManager:
         self.state_file = Path(state_file_path)
         self._lock = Lock()  # Thread-safe file access
         self._state_cache = None  # Cache to avoid repeated file reads
+        self._parent_created = False  # State directory created on first save
         logger.debug(f"Initialized StateManager with state file: {self.state_file}")
 
     def _load_state(self) -> dict:
@@ -143,23 +150,10 @@ class StateManager:
             if self._state_cache is not None:
                 return self._state_cache
 
-            # Create default state if file doesn't exist
-            if not self.state_file.exists():
-                logger.info("No state file found - creating new state")
-                default_state = {
-                    "version": self.STATE_VERSION,
-                    "files": {},
-                    "metadata": {
-                        "last_run_date": None
-                    }
-                }
-                self._state_cache = default_state
-                return default_state
-
-            # Load existing state
+            # Load existing state (read once, parsed from bytes - orjson when installed)
             try:
-                with open(self.state_file, 'r') as f:
-                    state_data = json.load(f)
+                raw = self.state_file.read_bytes()
+                state_data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
 
                 # Validate state version
                 if state_data.get('version') != self.STATE_VERSION:
@@ -177,6 +171,19 @@ class StateManager:
                 logger.debug(f"Loaded state with {len(state_data.get('files', {}))} file(s)")
                 return state_data
 
+            except FileNotFoundError:
+                # Create default state if file doesn't exist
+                logger.info("No state file found - creating new state")
+                default_state = {
+                    "version": self.STATE_VERSION,
+                    "files": {},
+                    "metadata": {
+                        "last_run_date": None
+                    }
+                }
+                self._state_cache = default_state
+                return default_state
+
             except Exception as e:
                 logger.error(f"Error loading state file: {e}. Starting with fresh state.")
                 default_state = {
@@ -196,13 +203,16 @@ class StateManager:
         """
         with self._lock:
             try:
-                # Create parent directory if needed
-                self.state_file.parent.mkdir(parents=True, exist_ok=True)
-
-                # Write state file (atomic write with temp file)
+                # Create parent directory if needed (first save only)
+                if not self._parent_created:
+                    self.state_file.parent.mkdir(parents=True, exist_ok=True)
+                    self._parent_created = True
+
+                # Serialize once, then write the bytes in a single call
+                # (atomic write with temp file)
+                body = json.dumps(state, indent=2).encode('utf-8')
                 temp_file = self.state_file.with_suffix('.tmp')
-                with open(temp_file, 'w') as f:
-                    json.dump(state, f, indent=2)
+                temp_file.write_bytes(body)
 
                 # Atomic rename
                 temp_file.replace(self.state_file)
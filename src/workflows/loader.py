@@ -95,6 +95,7 @@ SEE ALSO:
     - component_registry.py - Uses loaded workflow to create component instances
 """
 
+import functools
 import yaml
 from pathlib import Path
 from dotenv import load_dotenv
@@ -102,6 +103,20 @@ from dotenv import load_dotenv
 from .schema import WorkflowDefinition, SourceDestinationSpec, ComponentSpec, StateSpec, LoggingSpec
 
 
+@functools.lru_cache(maxsize=None)
+def _load_dotenv_once() -> bool:
+    """
+    Load the .env file into os.environ, once per process.
+
+    load_dotenv searches parent directories for the file on every call; the
+    result does not change between workflow loads, so it is done only once.
+
+    Returns:
+        True if a .env file was found and loaded
+    """
+    return load_dotenv()
+
+
 def load_workflow(yaml_path: Path) -> WorkflowDefinition:
     """
     Load workflow definition from YAML file.
@@ -121,8 +136,8 @@ def load_workflow(yaml_path: Path) -> WorkflowDefinition:
         workflow = load_workflow(Path('my-workflow.yaml'))
         print(workflow.source.implementation)  # 'bitbucket'
     """
-    # Load .env file if it exists (populates os.environ)
-    load_dotenv()
+    # Load .env file if it exists (populates os.environ, first call only)
+    _load_dotenv_once()
 
     # Validate file exists
     yaml_path = Path(yaml_path)